@@ -232,19 +232,25 @@ def dict_to_str(dictionary, s="", indent=0, ignore_null=False):
         BlaBlub: 2
     
     """
+    parts = [s]
+    _dict_to_str_parts(dictionary, parts, indent, ignore_null)
+    return ''.join(parts)
+
+def _dict_to_str_parts(dictionary, parts, indent=0, ignore_null=False):
+    """Helper for :func:`dict_to_str`, appends string parts to input list"""
     for k, v in dictionary.items():
         if ignore_null and v is None:
             continue
         elif isinstance(v, dict):
-            s += "\n{}{} ({}):".format(indent*' ', k, type(v).__name__)
-            s = dict_to_str(v, s, indent+2)
+            parts.append("\n{}{} ({}):".format(indent*' ', k, 
+                                               type(v).__name__))
+            _dict_to_str_parts(v, parts, indent+2)
         elif isinstance(v, list):
-            s += list_to_shortstr(v, indent=indent, name=k)
+            parts.append(list_to_shortstr(v, indent=indent, name=k))
         elif isinstance(v, np.ndarray) and v.ndim==1:
-            s += list_to_shortstr(v, indent=indent, name=k)
+            parts.append(list_to_shortstr(v, indent=indent, name=k))
         else:
-            s += "\n{}{}: {}".format(indent*" ", k, v)
-    return s
+            parts.append("\n{}{}: {}".format(indent*" ", k, v))
 
 def str_underline(s, indent=0):
     """Create underlined string"""
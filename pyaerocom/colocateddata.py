@@ -45,7 +45,8 @@ class ColocatedData(object):
         ID of reference data 
     **kwargs
         Additional keyword args that are passed to init of :class:`DataArray` 
-        in case input :arg:`data` is numpy array.
+        in case input :arg:`data` is numpy array, or to :func:`open` in case
+        :arg:`data` is a file path (e.g. ``chunks``).
         
     Raises
     ------
@@ -69,7 +70,7 @@ class ColocatedData(object):
                                   'Error: {}'.format(repr(e)))
                 self.data = data
             elif isinstance(data, str):
-                self.open(data)
+                self.open(data, **kwargs)
             else:
                 raise IOError('Failed to interpret input {}'.format(data))
                     
@@ -571,7 +572,7 @@ class ColocatedData(object):
         #meta['ts_type_src'] = ts_type_src
         return meta
       
-    def to_netcdf(self, out_dir, savename=None, **kwargs):
+    def to_netcdf(self, out_dir, savename=None, compress=False, **kwargs):
         """Save data object as .nc file
         
         Wrapper for method :func:`xarray.DataArray.to_netdcf` 
@@ -582,6 +583,10 @@ class ColocatedData(object):
         savename : :obj:`str`, optional
             name of file, if None, the default save name is used (cf. 
             :attr:`savename_aerocom`)
+        compress : bool
+            if True, the data is written chunked (full time series, up to 
+            512 stations per chunk) and zlib compressed (NetCDF4). Ignored if 
+            ``encoding`` is provided via ``kwargs``.
         **kwargs
             additional, optional keyword arguments passed to 
             :func:`xarray.DataArray.to_netdcf` 
@@ -609,15 +614,28 @@ class ColocatedData(object):
         if out is not None:
             self.data.attrs['_min_num_obs'] = out
             self.data.attrs.pop('min_num_obs')
+        if compress and not 'encoding' in kwargs:
+            name = self.data.name
+            if name is None:
+                name = '__xarray_dataarray_variable__'
+            chunks = tuple(min(512, n) if dim == 'station_name' else n 
+                           for dim, n in zip(self.data.dims, self.data.shape))
+            kwargs['encoding'] = {name : {'zlib'        : True, 
+                                          'complevel'   : 1,
+                                          'chunksizes'  : chunks}}
         self.data.to_netcdf(path=os.path.join(out_dir, savename), **kwargs)
       
-    def read_netcdf(self, file_path):
+    def read_netcdf(self, file_path, chunks=None):
         """Read data from NetCDF file
         
         Parameters
         ----------
         file_path : str
             file path
+        chunks : dict, optional
+            if provided, the data is opened lazily as dask array with the 
+            specified chunk sizes (e.g. ``{'time': -1, 'station_name': 1024}``,
+            requires dask), else as numpy backed array.
             
         """
         try:
@@ -625,7 +643,20 @@ class ColocatedData(object):
         except Exception as e:
             raise NetcdfError('Invlid file name for ColocatedData: {}.Error: {}'
                               .format(os.path.basename(file_path, repr(e))))
-        arr = xarray.open_dataarray(file_path)
+        if chunks is not None:
+            arr = xarray.open_dataarray(file_path, chunks=chunks)
+        else:
+            arr = xarray.open_dataarray(file_path)
+        self.data = self._decode_min_num_obs(arr)
+        return self
+    
+    @staticmethod
+    def _decode_min_num_obs(arr):
+        """Decode min_num_obs attribute of DataArray read from NetCDF
+        
+        The attribute is stored as string ``_min_num_obs`` in NetCDF files 
+        (cf. :func:`to_netcdf`) and converted back into a dictionary here.
+        """
         if '_min_num_obs' in arr.attrs:
             info = {}
             for val in arr.attrs['_min_num_obs'].split(';')[:-1]:
@@ -636,8 +667,7 @@ class ColocatedData(object):
                     info[to][fr] = {}
                 info[to][fr] = int(num)
             arr.attrs['min_num_obs'] = info
-        self.data = arr
-        return self
+        return arr
     
     def to_dataframe(self):
         """Convert this object into pandas.DataFrame
@@ -703,16 +733,19 @@ class ColocatedData(object):
         self.from_dataframe(df)
         self.data.attrs.update(**meta)
         
-    def open(self, file_path):
+    def open(self, file_path, **kwargs):
         """High level helper for reading from supported file sources
         
         Parameters
         ----------
         file_path : str
             file path
+        **kwargs
+            additional keyword args passed to the reading method (e.g. 
+            ``chunks`` for :func:`read_netcdf`)
         """
         if file_path.endswith('nc'):
-            self.read_netcdf(file_path)
+            self.read_netcdf(file_path, **kwargs)
             return
         
         raise IOError('Failed to import file {}. File type is not supported '
@@ -11,6 +11,7 @@ This module will be deprecated soon but most of the code will be refactored
 into colocation.py module.
 """
 from datetime import datetime
+from itertools import chain
 import numpy as np
 import os
 import traceback
@@ -156,6 +157,14 @@ class ColocationSetup(BrowseDict):
         specify model, else obs_id will be used
     save_coldata : bool
         if True, colocated data objects are saved as NetCDF file.
+    compress_coldata : bool
+        if True, colocated data files are written chunked and compressed 
+        (cf. :func:`ColocatedData.to_netcdf`). Defaults to False.
+    resample_cache_dir : str, optional
+        directory for caching time-resampled colocated data (used when 
+        computing json files for the AeroCom evaluation interface). If None, 
+        no caching is done. Outdated cache files are not removed 
+        automatically, use :func:`AerocomEvaluation.clear_resample_cache`.
     """ 
     #: Dictionary specifying alternative vertical types that may be used to 
     #: read model data. E.g. consider the variable is  ec550aer, 
@@ -249,6 +258,10 @@ class ColocationSetup(BrowseDict):
         #: If True, the colocation routine will raise any Exception that may occur, 
         #: else (False), expected expcetions will be ignored and logged.
         self.raise_exceptions = False
+        #: If True, colocated data files are saved chunked and compressed
+        self.compress_coldata = False
+        #: Directory for caching of resampled colocated data (None: no caching)
+        self.resample_cache_dir = None
         
         self.update(**kwargs)
     
@@ -266,8 +279,19 @@ class ColocationSetup(BrowseDict):
     def __dir__(self):
         return self.keys()
     
-    def update(self, **kwargs):
-        for key, val in kwargs.items():
+    def update(self, other=(), **kwargs):
+        """Update setup
+        
+        Parameters
+        ----------
+        other : dict or iterable, optional
+            dictionary or iterable of (key, value) pairs
+        **kwargs
+            further settings
+        """
+        if isinstance(other, dict):
+            other = other.items()
+        for key, val in chain(other, kwargs.items()):
             if key in self and isinstance(self[key], dict):
                 if not isinstance(val, dict):
                     raise ValueError('Cannot update dict {} with non-dict input {}'
@@ -510,7 +534,8 @@ class Colocator(ColocationSetup):
                                     model_var,
                                     self.obs_id)
         
-        coldata.to_netcdf(out_dir, savename=savename)
+        coldata.to_netcdf(out_dir, savename=savename, 
+                          compress=self.compress_coldata)
         self.file_status[savename] = 'saved'
         if self._log:
             self._write_log('WRITE: {}\n'.format(savename))
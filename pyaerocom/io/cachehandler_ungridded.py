@@ -7,7 +7,7 @@ from pyaerocom import const, logger, UngriddedData
 from pyaerocom.exceptions import (AerocomConnectionError, CacheReadError,
                                   CacheWriteError)
 
-import glob, os, pickle
+import glob, os, pickle, tempfile
 
 # TODO: Write data attribute list contains_vars in header of pickled file and
 # check if variables match the request
@@ -259,8 +259,13 @@ class CacheHandlerUngridded(object):
         fp = self.file_path(var_name)
         logger.info('Writing cache file: {}'.format(fp))
         success = True
+        # the data is written to a temporary file in the cache directory, 
+        # which is renamed when complete, so that other processes reading the 
+        # cache never see a partially written file
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(fp), 
+                                        suffix='.tmp')
         # OutHandle = gzip.open(c__cache_file, 'wb') # takes too much time
-        out_handle = open(fp, 'wb')
+        out_handle = os.fdopen(fd, 'wb')
         
         try:
             # write cache header
@@ -274,8 +279,14 @@ class CacheHandlerUngridded(object):
             success=False
         finally:    
             out_handle.close()
-            if not success:
-                os.remove(self.file_path)
+            if success:
+                # mkstemp creates files only readable by the owner
+                os.chmod(tmp_path, 0o644)
+                os.replace(tmp_path, fp)
+            else:
+                os.remove(tmp_path)
+        if not success:
+            return
         logger.info('Successfully wrote {} data ({}) to disk!'
                     .format(var_name, self.reader.data_id))
         
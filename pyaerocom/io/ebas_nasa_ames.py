@@ -7,6 +7,7 @@ For details on the file format see `here <https://ebas-submit.nilu.no/
 Submit-Data/Getting-started>`__
 """
 import os
+from itertools import islice
 import numpy as np
 import pandas as pd
 from collections import OrderedDict as od
@@ -65,13 +66,22 @@ class EbasColDef(dict):
         self.flag_col = None
         
     def get_wavelength_nm(self):
-        """Try to access wavelength information in nm (as float)"""
+        """Try to access wavelength information in nm (as float)
+        
+        Note
+        ----
+        The value is converted only once and is then stored in 
+        ``wavelength_nm``
+        """
+        if 'wavelength_nm' in self:
+            return self['wavelength_nm']
         if not 'wavelength' in self:
             raise KeyError('Column variable {} does not contain wavelength '
                            'information'.format(self.name))
         elif not 'nm' in self.wavelength:
             raise NotImplementedError('Wavelength definition is not in nm')
-        return float(self.wavelength.split('nm')[0].strip())
+        self['wavelength_nm'] = wvl = float(self.wavelength.split('nm')[0].strip())
+        return wvl
         
     def to_dict(self, ignore_keys=['is_var', 'is_flag', 'flag_col', 
                                    'wavelength_nm']):
@@ -825,6 +835,7 @@ class EbasNasaAmesFile(NasaAmesHeader):
                                                         is_var=False,
                                                         unit=self.time_unit))
                     if only_head:
+                        self.assign_flagcols()
                         return
                     logger.debug("REACHED DATA BLOCK")
                     _insert_invalid = tuple([np.nan]*self.col_num)
@@ -846,6 +857,73 @@ class EbasNasaAmesFile(NasaAmesHeader):
         
         
         
+        self._init_data(data, replace_invalid_nan, convert_timestamps, 
+                        evaluate_flags, quality_check)
+    
+    def read_data(self, replace_invalid_nan=True, convert_timestamps=True, 
+                  evaluate_flags=False, quality_check=False, usecols=None):
+        """Read data block of NASA Ames file for which only header was read
+        
+        Can be used to import the data in a file, which was previously 
+        loaded using ``only_head=True`` (e.g. after checking the header if 
+        the file contains relevant columns).
+        
+        Note
+        ----
+        If input ``usecols`` is specified, only these columns are converted
+        from the file (the data table keeps its original shape so that column
+        indices remain valid, all other columns are filled with NaN). In this 
+        case, flag columns that are not imported must not be decoded.
+        
+        Parameters
+        ----------
+        replace_invalid_nan : bool
+            replace all invalid values in the table by NaNs. 
+        convert_timestamps : bool
+            compute array of numpy datetime64 timestamps from numeric 
+            timestamps in data
+        evaluate_flags : bool
+            if True, the flags in all flag columns are decoded.
+        quality_check : bool
+            perform quality check after import (for details see 
+            :func:`_quality_check`)
+        usecols : :obj:`list`, optional
+            indices of columns to be imported. If None, all columns are read.
+            If convert_timestamps is True, this needs to include the first 
+            2 columns (start and stop time).
+        """
+        if self.file is None or len(self.var_defs) == 0:
+            raise NasaAmesReadError('Cannot read data block: file header '
+                                    'needs to be read first')
+        logger.info("Reading data block of NASA Ames file:\n{}"
+                    .format(self.file))
+        if usecols is None:
+            usecols = range(self.col_num)
+        else:
+            usecols = sorted(set(usecols))
+        _insert_invalid = tuple([np.nan]*len(usecols))
+        rows = []
+        with open(self.file) as f:
+            for dc, line in enumerate(islice(f, self.num_head_lines, None)):
+                try:
+                    spl = line.split()
+                    rows.append(tuple([float(spl[i]) for i in usecols]))
+                except Exception as e:
+                    rows.append(_insert_invalid)
+                    logger.warning("Failed to read data row {}. "
+                                   "Error msg: {}".format(dc, repr(e)))
+        if len(usecols) == self.col_num:
+            data = rows
+        else:
+            data = np.ones((len(rows), self.col_num)) * np.nan
+            if len(rows) > 0:
+                data[:, usecols] = np.asarray(rows)
+        self._init_data(data, replace_invalid_nan, convert_timestamps, 
+                        evaluate_flags, quality_check)
+        
+    def _init_data(self, data, replace_invalid_nan, convert_timestamps, 
+                   evaluate_flags, quality_check):
+        """Convert imported data rows into data table and postprocess"""
         data = np.asarray(data) 
         
         data[:, 1:] = data[:, 1:] * np.asarray(self.mul_factors)
@@ -110,6 +110,9 @@ class ReadSulphurAasEtAl(ReadUngriddedBase):
         dates_alt = [tconv(yr, m) for yr, m in
                      zip(df.year.values, df.month.values)]
         df['dtime'] = np.array(dates_alt)
+        # timestamps as seconds since epoch, computed once for all stations
+        df['time_s'] = (df['dtime'].values.astype('datetime64[ns]').view('i8') 
+                        // 1000000000).astype(np.float64)
 
         # array av numpy.datetime64
         df.rename(columns= {"Sampler":"instrument_name"}, inplace=True)
@@ -156,7 +159,7 @@ class ReadSulphurAasEtAl(ReadUngriddedBase):
                                              
                     s['variables'].append(var)
                 else:
-                    if key == 'dtime':
+                    if key in ('dtime', 'time_s'):
                         s[key] = station_group[key].values
                     else:
                         # Store the meta data. 
@@ -204,8 +207,10 @@ class ReadSulphurAasEtAl(ReadUngriddedBase):
 
         meta_key = 0.0
         idx = 0
-        varindex = -1
-        
+
+        # fixed slot of each variable in the data column _VARINDEX
+        var_slot = {var : i for i, var in enumerate(vars_to_retrieve)}
+
         #assign metadata object
         metadata = data_obj.metadata # OrderedDict
         meta_idx = data_obj.meta_idx # OrderedDict
@@ -221,6 +226,13 @@ class ReadSulphurAasEtAl(ReadUngriddedBase):
                 continue
             station_data_list = self.read_file(file, 
                                                vars_to_retrieve=var_matches)
+            
+            # total number of rows required for all stations in this file
+            totnum_file = sum(len(stat['dtime']) * len(stat['variables']) 
+                              for stat in station_data_list)
+            if (idx + totnum_file) >= data_obj._ROWNO:
+                data_obj.add_chunk(totnum_file)
+                
             for station_data in station_data_list:
                 #self.counter += 1
                 metadata[meta_key] = OrderedDict()
@@ -237,6 +249,7 @@ class ReadSulphurAasEtAl(ReadUngriddedBase):
 
                 metadata[meta_key]['instrument_name'] = instr
                 metadata[meta_key]['data_revision'] = self.data_revision
+                metadata[meta_key]['var_info'] = OrderedDict()
 
                 # this is a list with indices of this station for each variable
                 # not sure yet, if we really need that or if it speeds up things
@@ -245,27 +258,19 @@ class ReadSulphurAasEtAl(ReadUngriddedBase):
                 num_times = len(station_data['dtime'])
                 num_vars = len(station_data["variables"])
                 temp_vars = station_data["variables"]
-                tconv = station_data['dtime'].astype('datetime64[s]')
-                times = np.float64(tconv)
+                times = station_data['time_s']
                 totnum = num_times * num_vars
 
-                if (idx + totnum) >= data_obj._ROWNO:
-                    # This results in a error because it doesn't want to multiply empty with nan
-                    data_obj.add_chunk(totnum)
                 for var_count, var in enumerate(temp_vars):
 
                     values = station_data[var]
                     start = idx + var_count * num_times
                     stop = start + num_times
 
+                    var_idx = var_slot[var]
                     if not var in data_obj.var_idx:
-                        varindex += 1
-                        data_obj.var_idx[var] = varindex
-                        var_idx = varindex
-                    else:
-                        var_idx = data_obj.var_idx[var]
+                        data_obj.var_idx[var] = var_idx
 
-                    metadata[meta_key]['var_info'] = OrderedDict()
                     metadata[meta_key]['var_info'][var] = OrderedDict()
                     metadata[meta_key]['var_info'][var]['units'] = unit[var]
 
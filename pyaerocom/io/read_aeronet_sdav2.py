@@ -223,11 +223,6 @@ class ReadAeronetSdaV2(ReadAeronetBase):
         # create empty arrays for meta information
         for item in self.META_NAMES_FILE:
             data_out[item] = []
-            
-        # create empty arrays for all variables that are supposed to be read
-        # from file
-        for var in vars_to_read:
-            data_out[var] = []
         
         # Iterate over the lines of the file
         self.logger.info("Reading file {}".format(filename))
@@ -268,49 +263,33 @@ class ReadAeronetSdaV2(ReadAeronetBase):
                     self.logger.warning("Variable {} not available in file {}"
                                         .format(var, os.path.basename(filename)))
 
-            for line in in_file:
-                # process line
-                dummy_arr = line.split(self.COL_DELIM)
-                
-                # This uses the numpy datestring64 functions that e.g. also
-                # support Months as a time step for timedelta
-                # Build a proper ISO 8601 UTC date string
-                day, month, year = dummy_arr[col_index['date']].split(':')
-                # pdb.set_trace()
-                datestring = '-'.join([year, month, day])
-                datestring = 'T'.join([datestring, dummy_arr[col_index['time']]])
-                # NOTE JGLISS: parsing timezone offset was removed on 22/2/19
-                # since it is deprecated in recent numpy versions, for details
-                # see https://www.numpy.org/devdocs/reference/arrays.datetime.html#changes-with-numpy-1-11
-                #datestring = '+'.join([datestring, '00:00'])
-                data_out['dtime'].append(np.datetime64(datestring))
-
-                # copy the data fields 
-                for var, idx in vars_available.items():
-                    val = np.float_(dummy_arr[idx])
-                    if val == self.NAN_VAL: 
-                        val = np.nan
-                    data_out[var].append(val)
+            # read data block (dates, metadata and data columns)
+            data_block = self._read_data_block(in_file, vars_available, 
+                                               meta_names=[])
         
-        # convert all lists to numpy arrays
-        data_out['dtime'] = np.asarray(data_out['dtime'])
+        for key, val in data_block.items():
+            data_out[key] = val
         
+        # fill variables that are not available in this file with NaNs
+        num_times = len(data_out['dtime'])
         for var in vars_to_read:
-            if var in vars_available:
-                array = np.asarray(data_out[var])
-            else:
-                array = np.zeros(len(data_out['dtime'])) * np.nan
-            data_out[var] = array
+            if not var in vars_available:
+                data_out[var] = np.zeros(num_times) * np.nan
         
         # compute additional variables (if applicable)
         data_out = self.compute_additional_vars(data_out, vars_to_compute)
         
         # convert data vectors to pandas.Series (if applicable)
         if vars_as_series:        
+            # create time index only once for all variables
+            time_idx = pd.DatetimeIndex(data_out['dtime'])
+            if isinstance(vars_to_retrieve, str):
+                vars_to_retrieve = [vars_to_retrieve]
+            keep = set(vars_to_retrieve)
             for var in (vars_to_read + vars_to_compute):
-                if var in vars_to_retrieve:
+                if var in keep:
                     data_out[var] = pd.Series(data_out[var], 
-                                              index=data_out['dtime'])
+                                              index=time_idx)
                 else:
                     del data_out[var]
             
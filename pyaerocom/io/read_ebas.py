@@ -18,8 +18,9 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
 # MA 02110-1301, USA
 
-import os, re
+import os, re, pickle
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 import fnmatch
 import numpy as np
 from collections import OrderedDict as od
@@ -185,6 +186,9 @@ class ReadEbas(ReadUngriddedBase):
     
     
     IGNORE_WAVELENGTH = ['conceqbc']
+    
+    #: name of cache file for results of SQL file requests (in CACHEDIR)
+    _FILELIST_CACHE_NAME = 'ebas_filelist_cache.pkl'
     # list of all available resolution codes (extracted from SQLite database)
     # 1d 1h 1mo 1w 4w 30mn 2w 3mo 2d 3d 4d 12h 10mn 2h 5mn 6d 3h 15mn
     
@@ -226,11 +230,19 @@ class ReadEbas(ReadUngriddedBase):
         #: individually
         self._lists_orig = {}
         
-        #: this is filled in method get_file_list and specifies variables 
-        #: to be read from each file
-        self.files_contain = []
+        #: this is filled in method get_file_list and specifies (by index)
+        #: variables to be read from each file (files x variables)
+        self.files_contain_matrix = np.zeros((0, 0), dtype=bool)
+        self._files_contain_vars = []
         
         self._all_stats = None
+        
+        #: results from SQL file requests (cf. :func:`_get_file_names_cached`)
+        self._filelist_cache = None
+        
+        #: sets of EBAS component names for each variable (is updated in 
+        #: :func:`_get_var_cols`)
+        self._component_sets = {}
     
     @property
     def filelog(self):
@@ -306,48 +318,61 @@ class ReadEbas(ReadUngriddedBase):
         
         Note
         ----
-        In addition to writing the retrieved file list into :attr:`files`, this 
-        method also fills the list :attr:`files_contain` which (by index)
-        defines variables to read for each file path in :attr:`files`
+        In addition to writing the retrieved (sorted and unique) file list 
+        into :attr:`files`, this method also fills the boolean matrix 
+        :attr:`files_contain_matrix` which (by index) defines variables to 
+        read for each file path in :attr:`files` (cf. :attr:`files_contain`)
         
         Parameters
         ----------
         lists_per_var : dict
             dictionary containing file lists (values) for a set of variables
-            (keys)
+            (keys). The input lists are only read (not modified or copied) 
+            and are kept in :attr:`_lists_orig` by :func:`get_file_list`, so 
+            they should not be modified afterwards.
         
         Returns
         -------
         list
             merged file list (is also written into :attr:`files`)
         """
-        # original lists are modified, so make a copy of them
-        #lists = deepcopy(lists_per_var)
-        lists = lists_per_var
-        mapping = {}
-        for var, lst in lists.items():
-            for fpath in lst:
-                if fpath in mapping:
-                    raise Exception('FATAL: logical error -> this should not occur...')
-                mapping[fpath] = [var]
-                for other_var, other_lst in lists.items():
-                    if not var == other_var:
-                        try:
-                            other_lst.pop(other_lst.index(fpath))
-                            mapping[fpath].append(other_var)
-                        except ValueError:
-                            pass
-        self.logger.info('Number of files to read reduced to {}'.format(len(mapping)))
-        files, files_contain = [], []
-        for path, contains_vars in mapping.items():
-            files.append(path)
-            files_contain.append(contains_vars)
-            
+        var_names = list(lists_per_var.keys())
+        lists = [np.asarray(lst, dtype=str) for lst in lists_per_var.values()]
+        if sum(len(lst) for lst in lists) == 0:
+            files = []
+            member = np.zeros((0, len(var_names)), dtype=bool)
+        else:
+            uniq, inv = np.unique(np.concatenate(lists), return_inverse=True)
+            # boolean matrix (files x variables) specifying which variables
+            # are to be read from each file
+            member = np.zeros((len(uniq), len(var_names)), dtype=bool)
+            offs = 0
+            for i, lst in enumerate(lists):
+                num = len(lst)
+                member[inv[offs:offs+num], i] = True
+                offs += num
+            files = uniq.tolist()
+        self.logger.info('Number of files to read reduced to {}'.format(len(files)))
+        
         self.files = files
-        self.files_contain = files_contain
+        self.files_contain_matrix = member
+        self._files_contain_vars = var_names
         
         return files
     
+    @property
+    def files_contain(self):
+        """List specifying variables to read for each file in :attr:`files`
+        
+        Note
+        ----
+        Is computed from boolean matrix :attr:`files_contain_matrix` that is 
+        created in :func:`get_file_list` 
+        """
+        var_names = self._files_contain_vars
+        return [[var_names[i] for i in np.flatnonzero(row)] 
+                for row in self.files_contain_matrix]
+    
     @property
     def all_station_names(self):
         """List of all available station names in EBAS database"""
@@ -421,16 +446,17 @@ class ReadEbas(ReadUngriddedBase):
             
         self.logger.info('Fetching data files. This might take a while...')
         
-        db = self.file_index
         files_vars = {}
         totnum = 0
         const.print_log.info('Retrieving EBAS files for variables\n{}'
                              .format(vars_to_retrieve))
+        provides_vars = self.PROVIDES_VARIABLES
+        # data directory (with trailing separator) for file paths
+        data_dir = os.path.join(const.EBASMC_DATA_DIR, '')
         for var in vars_to_retrieve:
-            if not var in self.PROVIDES_VARIABLES:
+            if not var in provides_vars:
                 raise AttributeError('No such variable {}'.format(var))
-            info = EbasVarInfo(var)
-            self.loaded_ebas_vars[var] = info
+            info = self.get_ebas_var(var)
 
             if 'station_names' in constraints:
                 stat_matches = self.find_station_matches(constraints['station_names'])
@@ -444,13 +470,13 @@ class ReadEbas(ReadUngriddedBase):
             
             const.logger.info('Retrieving EBAS file list for request:\n{}'
                               .format(req))
-            filenames = db.get_file_names(req)
+            filenames = self._get_file_names_cached(req)
             self.sql_requests.append(req)
             
-            paths = []
-            for file in filenames:
-                paths.append(os.path.join(const.EBASMC_DATA_DIR, file))
-            files_vars[var] = sorted(paths)
+            # no sorting required here, the merged list of all variables 
+            # is sorted in _merge_lists
+            paths = [data_dir + file for file in filenames]
+            files_vars[var] = paths
             num = len(paths)
             totnum += num
             self.logger.info('{} files found for variable {}'.format(num, var))
@@ -463,7 +489,119 @@ class ReadEbas(ReadUngriddedBase):
         files = self._merge_lists(files_vars)
         return files
     
-    def _get_var_cols(self, ebas_var_info, data):
+    def _load_filelist_cache(self):
+        """Load cached results of SQL file requests from :attr:`CACHEDIR`
+        
+        The cache is only valid for the current state of the EBAS SQLite
+        database (identified via path and modification time of the database 
+        file). If the database has changed, an empty cache is returned.
+        
+        Returns
+        -------
+        dict
+            dictionary containing SQL request strings (keys) and the 
+            corresponding lists of file names (values)
+        """
+        db = self.file_index.database
+        self._filelist_cache = cache = {'database'  : db,
+                                        'mtime'     : os.path.getmtime(db),
+                                        'requests'  : {}}
+        fp = self._filelist_cache_file
+        if fp is None or not os.path.exists(fp):
+            return cache['requests']
+        try:
+            with open(fp, 'rb') as f:
+                loaded = pickle.load(f)
+            if (loaded['database'] == cache['database'] and 
+                loaded['mtime'] == cache['mtime']):
+                cache['requests'] = loaded['requests']
+        except Exception as e:
+            self.logger.warning('Failed to load EBAS file list cache {}. '
+                                'Reason: {}'.format(fp, repr(e)))
+        return cache['requests']
+    
+    @property
+    def _filelist_cache_file(self):
+        """Path to cache file for SQL file requests (None if unavailable)"""
+        try:
+            cachedir = const.CACHEDIR
+        except IOError:
+            return None
+        if cachedir is None:
+            return None
+        return os.path.join(cachedir, self._FILELIST_CACHE_NAME)
+    
+    def _get_file_names_cached(self, req):
+        """Get file names matching input SQL request (uses cache if possible)
+        
+        If caching is active (cf. :attr:`Config.CACHING`), results of 
+        previous SQL requests are loaded from a pickled cache file and the
+        database is only queried for new requests. 
+        
+        Parameters
+        ----------
+        req : EbasSQLRequest
+            SQL request
+        
+        Returns
+        -------
+        list
+            list of file names matching the request
+        """
+        if not const.CACHING:
+            return self.file_index.get_file_names(req)
+        if self._filelist_cache is None:
+            self._load_filelist_cache()
+        requests = self._filelist_cache['requests']
+        
+        key = req.make_file_query_str()
+        if key in requests:
+            self.logger.info('Using cached EBAS file list for request')
+            return requests[key]
+        
+        filenames = self.file_index.get_file_names(req)
+        requests[key] = filenames
+        fp = self._filelist_cache_file
+        if fp is not None:
+            try:
+                with open(fp, 'wb') as f:
+                    pickle.dump(self._filelist_cache, f, 
+                                protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception as e:
+                self.logger.warning('Failed to write EBAS file list cache {}. '
+                                    'Reason: {}'.format(fp, repr(e)))
+        return filenames
+    
+    @staticmethod
+    def _get_col_name_index(data):
+        """Map column names in NASA Ames file to corresponding column numbers
+        
+        Parameters
+        ----------
+        data : EbasNasaAmesFile
+            loaded EBAS file data (header is sufficient)
+        
+        Returns
+        -------
+        dict
+            keys are column names, values are lists of column numbers
+        """
+        name_to_cols = {}
+        for colnum, col_info in enumerate(data.var_defs):
+            if col_info.name in name_to_cols:
+                name_to_cols[col_info.name].append(colnum)
+            else:
+                name_to_cols[col_info.name] = [colnum]
+        return name_to_cols
+        
+    def _get_component_set(self, ebas_var_info):
+        """Get (cached) set of EBAS component names of input variable"""
+        var = ebas_var_info.var_name
+        if not var in self._component_sets:
+            self._component_sets[var] = frozenset(ebas_var_info.component)
+        return self._component_sets[var]
+    
+    def _get_var_cols(self, ebas_var_info, data, name_to_cols=None):
         """Get all columns in NASA Ames file matching input Aerocom variable
         
         Note
@@ -480,6 +618,9 @@ class ReadEbas(ReadUngriddedBase):
             EBAS variable information (e.g. for absc550aer)
         data : EbasNasaAmesFile
             loaded EBAS file data
+        name_to_cols : :obj:`dict`, optional
+            mapping of column names to column numbers in file (cf. 
+            :func:`_get_col_name_index`). Is computed if None.
         
         Returns
         -------
@@ -498,28 +639,36 @@ class ReadEbas(ReadUngriddedBase):
         check_matrix = False if ebas_var_info['matrix'] is None else True
         check_stats = False if ebas_var_info['statistics'] is None else True
         
-        for colnum, col_info in enumerate(data.var_defs):
-            if col_info.name in ebas_var_info.component: #candidate (name match)
-                ok = True 
-                if check_matrix:
-                    if 'matrix' in col_info:
-                        matrix = col_info['matrix']
-                    else:
-                        matrix = data.matrix
-                    if not matrix in ebas_var_info['matrix']:
-                        ok = False
-                if ok and 'statistics' in col_info:
-                    # ALWAYS ignore columns containing statistics flagged in
-                    # ignore_statistics
-                    if col_info['statistics'] in self.ignore_statistics:
-                        ok = False
-                    elif check_stats:
-                        if not col_info['statistics'] in ebas_var_info['statistics']:
-                            ok=False
-                
-                if ok:
-                    col_matches.append(colnum)
-        if len(col_matches) == 0:
+        if name_to_cols is None:
+            name_to_cols = self._get_col_name_index(data)
+        
+        candidates = []
+        components = self._get_component_set(ebas_var_info)
+        for name in components.intersection(name_to_cols):
+            candidates.extend(name_to_cols[name])
+        
+        for colnum in sorted(candidates): #candidates (name match)
+            col_info = data.var_defs[colnum]
+            ok = True 
+            if check_matrix:
+                if 'matrix' in col_info:
+                    matrix = col_info['matrix']
+                else:
+                    matrix = data.matrix
+                if not matrix in ebas_var_info['matrix']:
+                    ok = False
+            if ok and 'statistics' in col_info:
+                # ALWAYS ignore columns containing statistics flagged in
+                # ignore_statistics
+                if col_info['statistics'] in self.ignore_statistics:
+                    ok = False
+                elif check_stats:
+                    if not col_info['statistics'] in ebas_var_info['statistics']:
+                        ok=False
+            
+            if ok:
+                col_matches.append(colnum)
+        if not col_matches:
             raise NotInFileError("Variable {} could not be found in "
                                  "file".format(ebas_var_info.var_name))
         return col_matches
@@ -601,6 +750,8 @@ class ReadEbas(ReadUngriddedBase):
                                  'please debug')
             # multiple column matches were found, use the one that contains 
             # less NaNs
+            if len(file.data) == 0: # only header was read so far
+                file.read_data(quality_check=True)
             num_invalid = []
             for colnum in result_col:
                 num_invalid.append(np.isnan(file.data[:, colnum]).sum())
@@ -632,9 +783,8 @@ class ReadEbas(ReadUngriddedBase):
         
         # write meta information
         tres_code = meta['resolution_code']
-        try:
-            ts_type = self.TS_TYPE_CODES[tres_code]
-        except KeyError:
+        ts_type = self.TS_TYPE_CODES.get(tres_code)
+        if ts_type is None:
             ival = re.findall('\d+', tres_code)[0]
             code = tres_code.split(ival)[-1]
             if not code in self.TS_TYPE_CODES:
@@ -646,13 +796,10 @@ class ReadEbas(ReadUngriddedBase):
         data_out['ts_type'] = ts_type
         # altitude of station
         try:
-            altitude = float(meta['station_altitude'].split(' ')[0])
+            altitude = float(meta['station_altitude'].partition(' ')[0])
         except:
             altitude = np.nan
-        try:
-            meas_height = float(meta['measurement_height'].split(' ')[0])
-        except KeyError:
-            meas_height = 0.0
+        meas_height = float(meta.get('measurement_height', '0 m').partition(' ')[0])
         
         data_alt = altitude + meas_height
             
@@ -700,37 +847,27 @@ class ReadEbas(ReadUngriddedBase):
     def _find_wavelength_matches(self, col_matches, file, var_info):
         """
         """
-        min_diff_wvl = 1e6
-        matches = []
         # get wavelength of column and tolerance
         wvl = var_info.wavelength_nm
-        wvl_low = wvl - self.wavelength_tol_nm
-        wvl_high = wvl + self.wavelength_tol_nm
-        
-        for colnum in col_matches:
+        wvls_col = np.ones(len(col_matches)) * np.nan
+        for i, colnum in enumerate(col_matches):
             colinfo = file.var_defs[colnum]
             if not 'wavelength' in colinfo:
                 const.print_log.warn('Ignoring column {} ({}) in EBAS file for '
                                      'reading var {}: column misses wavelength '
                                      'specification'
                                      .format(colnum, colinfo, var_info))
-        
-            wvl_col = colinfo.get_wavelength_nm()
-            # wavelength is in tolerance range
-            if wvl_low <= wvl_col <= wvl_high:
-                wvl_diff = wvl_col - wvl
-                if abs(wvl_diff) < abs(min_diff_wvl):
-                    # the wavelength difference of this column to
-                    # the desired wavelength of the variable is 
-                    # smaller than any of the detected before, so
-                    # ignore those from earlier columns by reinit
-                    # of the matches list
-                    min_diff_wvl = wvl_diff
-                    matches = []
-                    matches.append(colnum)
-                elif wvl_diff == min_diff_wvl:
-                    matches.append(colnum)
-        return matches
+                continue
+            wvls_col[i] = colinfo.get_wavelength_nm()
+        
+        wvl_diffs = wvls_col - wvl
+        # NaNs (columns without wavelength) are outside the tolerance range
+        in_range = np.abs(wvl_diffs) <= self.wavelength_tol_nm
+        if not in_range.any():
+            return []
+        # column(s) closest to the desired wavelength of the variable
+        min_diff_wvl = wvl_diffs[in_range][np.argmin(np.abs(wvl_diffs[in_range]))]
+        return [col_matches[i] for i in np.where(wvl_diffs == min_diff_wvl)[0]]
     
     def find_var_cols(self, vars_to_read, loaded_nasa_ames):
         """Find best-match variable columns in loaded NASA Ames file
@@ -758,22 +895,21 @@ class ReadEbas(ReadUngriddedBase):
         """
         file = loaded_nasa_ames
         var_cols = {}
+        name_to_cols = self._get_col_name_index(file)
         # Loop over all variables that are supposed to be read
         for var in vars_to_read:
             # get corresponding EBAS variable info ...
-            ebas_var_info = self.loaded_ebas_vars[var]
+            ebas_var_info = self.get_ebas_var(var)
             # ... and AeroCom variable definition
-            if not var in self.loaded_aerocom_vars:
-                self.loaded_aerocom_vars[var] = var_info = const.VARS[var]
-            else:
-                var_info = self.loaded_aerocom_vars[var]
+            var_info = self.var_info(var)
             # Find all columns in file that match the current variable 
             # There may be multiple matches, e.g. because the variable may
             # be sampled at different wavelenghts or there may be different 
             # statistics applied, or there may be different matrices
             # available (e.g. aerosol, pm10, pm25)
             try:
-                col_matches = self._get_var_cols(ebas_var_info, file)
+                col_matches = self._get_var_cols(ebas_var_info, file, 
+                                                 name_to_cols)
             except NotInFileError:
                 const.logger.warning('Variable {} (EBAS name(s): {}) is '
                                      'missing in file {} (start: {})'
@@ -790,11 +926,11 @@ class ReadEbas(ReadUngriddedBase):
                 col_matches = self._find_wavelength_matches(col_matches,
                                                             file, var_info)
 
-            if bool(col_matches):
+            if col_matches:
                 # loop was interrupted since exact wavelength match was found
                 var_cols[var] = col_matches
         
-        if not len(var_cols) > 0:
+        if not var_cols:
             raise NotInFileError('None of the specified variables {} could be '
                                  'found in file {}'.format(vars_to_read,
                                                 os.path.basename(file.file)))
@@ -802,7 +938,7 @@ class ReadEbas(ReadUngriddedBase):
         for var, cols in var_cols.items():
             if len(cols) > 1:
                 col = self._find_best_data_column(cols, 
-                                                  self.loaded_ebas_vars[var],
+                                                  self.get_ebas_var(var),
                                                   file)
                 var_cols[var] = col
         return var_cols
@@ -834,19 +970,28 @@ class ReadEbas(ReadUngriddedBase):
             vars_to_read, vars_to_compute = _vars_to_read, _vars_to_compute
         
         for var in vars_to_read:
-            if not var in self.loaded_ebas_vars:
-                self.loaded_ebas_vars[var] = EbasVarInfo(var)
-            
-            if self.loaded_ebas_vars[var].requires is not None:
-                for aux_var in self.loaded_ebas_vars[var].requires:
-                    if not aux_var in self.loaded_ebas_vars:
-                        self.loaded_ebas_vars[aux_var] = EbasVarInfo(aux_var)  
+            requires = self.get_ebas_var(var).requires
+            if requires is not None:
+                for aux_var in requires:
+                    self.get_ebas_var(aux_var)
             
-        file = EbasNasaAmesFile(filename)
+        # read only the header first, so that the import of the data block 
+        # can be skipped if none of the variables is available in the file
+        file = EbasNasaAmesFile(filename, only_head=True)
         
         # find columns in NASA Ames file for variables that are to be read
         var_cols = self.find_var_cols(vars_to_read=vars_to_read,
                                       loaded_nasa_ames=file)
+        if len(file.data) == 0:
+            # import only the time columns and the required data (and flag) 
+            # columns
+            usecols = [0, 1]
+            for colnums in var_cols.values():
+                usecols.extend(colnums)
+                if self.eval_flags:
+                    usecols.extend([file.var_defs[c].flag_col for c in colnums
+                                    if file.var_defs[c].flag_col is not None])
+            file.read_data(quality_check=True, usecols=usecols)
         #create empty data object (is dictionary with extended functionality)
         data_out = StationData()
         
@@ -855,18 +1000,22 @@ class ReadEbas(ReadUngriddedBase):
         #data_out['ebas_meta'] = meta
         data_out['var_info'] = {}
         #totnum = file.data.shape[0]
-        for var, colnums  in var_cols.items():
-            data_out['var_info'][var] = {}
+        for colnums in var_cols.values():
             if len(colnums) != 1:
                 raise Exception('Something went wrong...please debug')
+        cols = [colnums[0] for colnums in var_cols.values()]
+        # extract all required data columns at once (one row per variable)
+        col_data = np.ascontiguousarray(file.data[:, cols].T)
+        for i, (var, colnums) in enumerate(var_cols.items()):
+            data_out['var_info'][var] = {}
             colnum = colnums[0]
             _col = file.var_defs[colnum]
-            data = file.data[:, colnum]
+            data = col_data[i]
             
             if self.eval_flags:
                 invalid = ~file.flag_col_info[_col.flag_col].valid
                 data_out.data_flagged[var] = invalid
-            sf = self.loaded_ebas_vars[var].scale_factor
+            sf = self.get_ebas_var(var).scale_factor
             if sf != 1:
                 data *= sf
                 data_out['var_info'][var]['scale_factor'] = sf
@@ -916,7 +1065,7 @@ class ReadEbas(ReadUngriddedBase):
     
     def _convert_varunit_stationdata(self, sd, var):
         from_unit = sd.var_info[var]['units']
-        to_unit = self.loaded_aerocom_vars[var]['units']
+        to_unit = self.var_info(var)['units']
         if from_unit != to_unit:
             sd.convert_unit(var, to_unit)    
         return sd
@@ -952,10 +1101,7 @@ class ReadEbas(ReadUngriddedBase):
             if not var in data: # variable could not be computed -> ignore
                 continue
             
-            if not var in self.loaded_ebas_vars:
-                self.loaded_ebas_vars[var] = EbasVarInfo(var)
-            
-            data.var_info[var] = self.loaded_ebas_vars[var]
+            data.var_info[var] = self.get_ebas_var(var)
 
             if var in self.AUX_USE_META:
                 to_dict = data['var_info'][var]
@@ -986,6 +1132,16 @@ class ReadEbas(ReadUngriddedBase):
             self.loaded_aerocom_vars[var_name] = const.VARS[var_name]
         return self.loaded_aerocom_vars[var_name]
     
+    def get_ebas_var(self, var_name):
+        """Get instance of :class:`EbasVarInfo` for input AeroCom variable
+        
+        The EBAS import information for each variable is only parsed once 
+        from ebas_config.ini and then cached in :attr:`loaded_ebas_vars`
+        """
+        if not var_name in self.loaded_ebas_vars:
+            self.loaded_ebas_vars[var_name] = EbasVarInfo(var_name)
+        return self.loaded_ebas_vars[var_name]
+    
     def read(self, vars_to_retrieve=None, first_file=None, 
              last_file=None, multiproc=False, files=None, **constraints):
         """Method that reads list of files as instance of :class:`UngriddedData`
@@ -1001,6 +1157,11 @@ class ReadEbas(ReadUngriddedBase):
         last_file : :obj:`int`, optional
             index of last file in list to read. If None, the very last file 
             in the list is used
+        multiproc : bool
+            if True, the files are read in parallel using multiple processes
+        files : :obj:`list`, optional
+            list of files to be read. If None, then the file list is retrieved
+            using :func:`get_file_list`.
         **constraints
             further reading constraints deviating from default (default 
             info for each AEROCOM variable can be found in `ebas_config.ini <
@@ -1055,40 +1216,35 @@ class ReadEbas(ReadUngriddedBase):
         files_contain = files_contain[first_file:last_file]
         
         
-        if not multiproc:
-            data = self._read_files(files, vars_to_retrieve,
-                                    files_contain, constraints)
-        else:
-            raise NotImplementedError('Coming soon...')
+        data = self._read_files(files, vars_to_retrieve, files_contain, 
+                                constraints, multiproc)
         data.clear_meta_no_data()
-# =============================================================================
-#             from multiprocessing import Pool, Manager, cpu_count
-#             from functools import partial
-#             num_proc = cpu_count()
-#             func = partial(self._append_read_files, 
-#                            vars_to_retrieve=vars_to_retrieve,
-#                            files_contain=files_contain,
-#                            constraints=constraints)
-#             lists = np.array_split(files, num_proc)
-#             with Manager() as manager:
-#                 result = manager.list()
-#                 p = Pool(processes=num_proc)
-#                 for sub in lists:
-#                     p.apply_async(func, (sub, result))
-#                 p.close()
-#                 p.join()
-#             
-#             data = result
-# =============================================================================
         return data
     
-    def _read_files(self, files, vars_to_retrieve, files_contain, constraints):
+    def _read_file_noraise(self, filename, vars_to_retrieve):
+        """Helper for :func:`_read_files` that returns errors instead of raising
+        
+        Returns
+        -------
+        StationData or Exception
+            loaded data or the exception that occurred while reading the file
+        """
+        try:
+            return self.read_file(filename, vars_to_retrieve=vars_to_retrieve)
+        except Exception as e:
+            return e
+    
+    def _read_files(self, files, vars_to_retrieve, files_contain, constraints,
+                    multiproc=False):
         """Helper that reads list of files into UngriddedData
         
         Note
         ----
         This method is not supposed to be called directly but is used in 
-        :func:`read` and serves the purpose of parallel loading of data
+        :func:`read` and serves the purpose of parallel loading of data. If 
+        ``multiproc`` is True, the individual files are read in parallel 
+        using a pool of processes (one per CPU) and are then appended to the 
+        data object in the order of the input file list.
         """
         data_obj = UngriddedData()
         
@@ -1112,26 +1268,31 @@ class ReadEbas(ReadUngriddedBase):
         # counter that is updated whenever a new variable appears during read
         # (is used for attr. var_idx in UngriddedData object)
         var_count_glob = -1
+        if multiproc:
+            chunksize = max(1, num_files // (os.cpu_count() * 4))
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(self._read_file_noraise, files, 
+                                            files_contain, 
+                                            chunksize=chunksize))
+        else:
+            results = map(self._read_file_noraise, files, files_contain)
+            
         last_t = datetime.now()
-        for i, _file in enumerate(files):
+        for i, (_file, station_data) in enumerate(zip(files, results)):
             if i%disp_each == 0:
                 last_t = _print_read_info(i, disp_each, num_files, 
                                           last_t, type(self).__name__,
                                           const.print_log)
-            try:
-                station_data = self.read_file(_file, 
-                                              vars_to_retrieve=files_contain[i])
-                
-            except (NotInFileError, EbasFileError) as e:
+            if isinstance(station_data, (NotInFileError, EbasFileError)):
                 self.files_failed.append(_file)
                 self.logger.warning('Skipping reading of EBAS NASA Ames '
                                     'file: {}. Reason: {}'
-                                    .format(_file, repr(e)))
+                                    .format(_file, repr(station_data)))
                 continue
-            except Exception as e:
+            elif isinstance(station_data, Exception):
                 const.print_log.warning('Skipping reading of EBAS NASA Ames '
                                         'file: {}. Reason: {}'
-                                        .format(_file, repr(e)))
+                                        .format(_file, repr(station_data)))
 
                 continue
             
@@ -252,10 +252,12 @@ class ReadGAW(ReadUngriddedBase):
         # convert data vectors to pandas.Series (if attribute 
         # vars_as_series=True)
         if vars_as_series:        
+            # create time index only once for all variables
+            time_idx = pd.DatetimeIndex(data_out['dtime'])
             for var in vars_to_retrieve_file:
                 if var in data_out:
                     data_out[var] = pd.Series(data_out[var], 
-                                              index=data_out['dtime'])        
+                                              index=time_idx)        
         
         return data_out
     
@@ -1,15 +1,90 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import os, re, sys
 import numpy as np
+import pandas as pd
 from datetime import datetime
-from collections import OrderedDict as od
+from bisect import bisect_left
+from functools import partial
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
+from collections import OrderedDict as od, defaultdict
 from pyaerocom.io.readungriddedbase import ReadUngriddedBase
 from pyaerocom.io.helpers import _print_read_info
 from pyaerocom.ungriddeddata import UngriddedData
-from pyaerocom.mathutils import numbers_in_str
 from pyaerocom.exceptions import MetaDataError, VariableNotFoundError
 from pyaerocom import const, print_log
 
+#: regular expression for (integer) numbers in column names
+_NUM_RE = re.compile(r'\d+')
+
+def _parse_dtime(dates, times):
+    """Convert Aeronet date and time strings into datetime64[s]
+    
+    The conversion is done on the raw bytes of the fixed width strings 
+    (dd:mm:yyyy and hh:mm:ss) using numpy arithmetic. If the input does not
+    match these formats or contains values outside the valid ranges (e.g. 
+    day 31 in February), pandas is used instead (which raises an exception 
+    for invalid dates).
+    
+    Parameters
+    ----------
+    dates : array-like
+        date strings (dd:mm:yyyy)
+    times : array-like
+        time strings (hh:mm:ss)
+        
+    Returns
+    -------
+    ndarray
+        array of timestamps (dtype datetime64[s])
+    """
+    # one more character than needed, to detect strings that are too long
+    d = np.frombuffer(np.asarray(dates, dtype='S11').tobytes(), 
+                      dtype=np.uint8).reshape(-1, 11).astype(np.int64)
+    t = np.frombuffer(np.asarray(times, dtype='S9').tobytes(), 
+                      dtype=np.uint8).reshape(-1, 9).astype(np.int64)
+    sep = ord(':')
+    valid = ((d[:, 10] == 0).all() and (t[:, 8] == 0).all() and
+             (d[:, [2, 5]] == sep).all() and (t[:, [2, 5]] == sep).all())
+    d -= ord('0')
+    t -= ord('0')
+    d_digits = d[:, [0, 1, 3, 4, 6, 7, 8, 9]]
+    t_digits = t[:, [0, 1, 3, 4, 6, 7]]
+    valid = (valid and ((d_digits >= 0) & (d_digits <= 9)).all() and 
+             ((t_digits >= 0) & (t_digits <= 9)).all())
+    if not valid:
+        return _parse_dtime_pandas(dates, times)
+    day = d[:, 0] * 10 + d[:, 1]
+    month = d[:, 3] * 10 + d[:, 4]
+    year = d[:, 6] * 1000 + d[:, 7] * 100 + d[:, 8] * 10 + d[:, 9]
+    hour = t[:, 0] * 10 + t[:, 1]
+    minute = t[:, 3] * 10 + t[:, 4]
+    sec = t[:, 6] * 10 + t[:, 7]
+    months = ((year - 1970) * 12 + month - 1).astype('datetime64[M]')
+    days = months.astype('datetime64[D]')
+    # the datetime64 arithmetic below silently rolls over invalid values 
+    # (e.g. 31:02:2019 into March), these are checked here
+    days_in_month = ((months + 1).astype('datetime64[D]') - 
+                     days).astype(np.int64)
+    in_range = ((month >= 1) & (month <= 12) & 
+                (day >= 1) & (day <= days_in_month) &
+                (hour <= 23) & (minute <= 59) & (sec <= 59)).all()
+    if not in_range:
+        return _parse_dtime_pandas(dates, times)
+    secs = hour * 3600 + minute * 60 + sec
+    dtime = days + (day - 1).astype('timedelta64[D]')
+    return dtime.astype('datetime64[s]') + secs.astype('timedelta64[s]')
+
+def _parse_dtime_pandas(dates, times):
+    """Convert Aeronet date and time strings using pandas
+    
+    Fallback for :func:`_parse_dtime`
+    """
+    dtime = pd.to_datetime(pd.Series(dates) + ' ' + pd.Series(times),
+                           format='%d:%m:%Y %H:%M:%S')
+    return dtime.values.astype('datetime64[s]')
+
 class ReadAeronetBase(ReadUngriddedBase):
     """TEMPLATE: Abstract base class template for reading of Aeronet data
     
@@ -57,12 +132,17 @@ class ReadAeronetBase(ReadUngriddedBase):
     UNITS = {}
     
     IGNORE_META_KEYS = ['date', 'time', 'day_of_year']
+    
+    #: maximum number of file headers for which the column index information
+    #: is cached (cf. :func:`_update_col_index`)
+    COL_INDEX_CACHE_SIZE = 32
+    
     def __init__(self, dataset_to_read=None):
         super(ReadAeronetBase, self).__init__(dataset_to_read)
         
         # dictionary that contains information about the file columns
         # is written in method _update_col_index
-        self._col_index = od()
+        self._col_index = {}
         
         # header string referring to the content in attr. col_index. Is 
         # updated whenever the former is updated (i.e. when method
@@ -73,7 +153,20 @@ class ReadAeronetBase(ReadUngriddedBase):
         self._last_col_index_str = None
         self._last_col_order = []
         
-        self._alt_var_cols = {}
+        # column index information for previously read file headers
+        self._col_index_cache = od()
+        
+        # alternative data columns (values) used for variables (keys) 
+        # that were identified within wavelength tolerance
+        self._alt_var_cols = defaultdict(set)
+        
+        # variable information (Variable instances) accessed in 
+        # _search_var_wavelength_tol
+        self._var_info_cache = {}
+        
+        # read options (usecols, dtypes) for data block of files, are reused
+        # for all files that share the same header
+        self._read_opts_cache = {}
     
     @property
     def TS_TYPE(self):
@@ -129,7 +222,7 @@ class ReadAeronetBase(ReadUngriddedBase):
         ValueError
             if None or more than one number is detected in variable string
         """
-        nums = numbers_in_str(colname)
+        nums = _NUM_RE.findall(colname)
         if len(nums) == 1:
             if low <= int(nums[0]) <= high:
                 self.logger.debug('Succesfully extracted wavelength {} nm '
@@ -144,7 +237,8 @@ class ReadAeronetBase(ReadUngriddedBase):
         Note
         ----
         If successful (no exceptions raised), then this methods overwrites the 
-        current column index information stored in :attr:`col_index`.
+        current column index information stored in :attr:`col_index`. Results
+        are cached for the last :attr:`COL_INDEX_CACHE_SIZE` header strings.
         
         Parameters
         ----------
@@ -166,8 +260,17 @@ class ReadAeronetBase(ReadUngriddedBase):
         MetaDataError
             if one of the specified meta data columns does not exist in data
         """
+        key = (col_index_str, use_all_possible)
+        if key in self._col_index_cache:
+            col_index, cols = self._col_index_cache[key]
+            self._col_index_cache.move_to_end(key)
+            self._col_index = col_index
+            self._last_col_index_str = col_index_str
+            self._last_col_order = cols
+            return col_index
+        
         cols = col_index_str.strip().split(self.COL_DELIM)
-        mapping = od()
+        mapping = {}
         for idx, info_str in enumerate(cols):
             mapping[info_str] = idx
         
@@ -178,11 +281,15 @@ class ReadAeronetBase(ReadUngriddedBase):
         self._col_index = col_index
         self._last_col_index_str = col_index_str
         self._last_col_order = cols
+        
+        self._col_index_cache[key] = (col_index, cols)
+        if len(self._col_index_cache) > self.COL_INDEX_CACHE_SIZE:
+            self._col_index_cache.popitem(last=False)
         return col_index
     
     def _find_vars_pattern_based(self, mapping):
         raise NotImplementedError
-        col_index = od()
+        col_index = {}
         # find meta indices
         for key, val in self.META_NAMES_FILE.items():
             if not val in mapping:
@@ -210,13 +317,14 @@ class ReadAeronetBase(ReadUngriddedBase):
         return col_index
         
     def _find_vars_name_based(self, mapping, cols):
-        col_index = od()
+        col_index = {}
         # find meta indices
         for key, val in self.META_NAMES_FILE.items():
             if not val in mapping:
                 raise MetaDataError("Required meta-information string {} could "
                                     "not be found in file header".format(val))
             col_index[key] = mapping[val]
+        wvl_index = None
         for var, colname in self.VAR_NAMES_FILE.items():
             if colname in mapping:
                 col_index[var] = mapping[colname]  
@@ -228,8 +336,11 @@ class ReadAeronetBase(ReadUngriddedBase):
                             known = True
                             col_index[var] = mapping[alt_colname]
                 if not known:
+                    if wvl_index is None:
+                        wvl_index = self._make_wvl_index(cols)
                     try:
-                        idx = self._search_var_wavelength_tol(var, cols)
+                        idx = self._search_var_wavelength_tol(var, cols,
+                                                              wvl_index)
                         col_index[var] = idx
                     except Exception as e:
                         self.logger.info('Failed to infer data column of '
@@ -237,9 +348,59 @@ class ReadAeronetBase(ReadUngriddedBase):
                                          'range.Error:\n{}'.format(var, repr(e)))
         return col_index
     
-    def _search_var_wavelength_tol(self, var, cols):
-        """Find alternative variable within acceptance range"""
-        var_info = const.VARS[var]
+    def _make_wvl_index(self, cols):
+        """Group header columns that contain a wavelength by name mask
+        
+        Parameters
+        ----------
+        cols : list
+            list of column names in file header
+            
+        Returns
+        -------
+        dict
+            keys are column names with wavelength removed, values are lists
+            of (wavelength, column index) tuples, sorted by wavelength
+        """
+        wvl_index = {}
+        for i, col in enumerate(cols):
+            try:
+                wvl_str_col = self.infer_wavelength_colname(col)
+            except ValueError:
+                continue
+            mask = col.replace(wvl_str_col, '')
+            if not mask in wvl_index:
+                wvl_index[mask] = []
+            wvl_index[mask].append((float(wvl_str_col), i))
+        for candidates in wvl_index.values():
+            candidates.sort()
+        return wvl_index
+    
+    def _search_var_wavelength_tol(self, var, cols, wvl_index=None):
+        """Find alternative variable within acceptance range
+        
+        Parameters
+        ----------
+        var : str
+            variable name
+        cols : list
+            list of column names in file header
+        wvl_index : dict, optional
+            output from :func:`_make_wvl_index` for input columns, is computed
+            if unspecified.
+        
+        Returns
+        -------
+        int
+            index of column that is closest to the wavelength of the 
+            variable
+        """
+        if wvl_index is None:
+            wvl_index = self._make_wvl_index(cols)
+        try:
+            var_info = self._var_info_cache[var]
+        except KeyError:
+            var_info = self._var_info_cache[var] = const.VARS[var]
         colname = self.VAR_NAMES_FILE[var]
         
         wvl = var_info.wavelength_nm
@@ -263,27 +424,21 @@ class ReadAeronetBase(ReadUngriddedBase):
         # name and the extracted number corresponds to 
         # the expected wavelength as inferred from 
         # pyaerocom.Variable instance
-        wvl_diff_min = 1e6
+        candidates = wvl_index.get(check_mask, [])
         
-        # loop over header
-        for i, col in enumerate(cols):
-            try:
-                wvl_str_col = self.infer_wavelength_colname(col)
-            except:
-                pass
-            else:
-                wvl_col = float(wvl_str_col)
-                if low <= wvl_col <= high:
-                    mask = col.replace(wvl_str_col, '')
-                    if check_mask == mask:
-                        diff = abs(wvl_col - wvl)
-                        if diff < wvl_diff_min:
-                            wvl_diff_min = diff
-                            if not var in self._alt_var_cols:
-                                self._alt_var_cols[var] = []
-                            if not col in self._alt_var_cols[var]:
-                                self._alt_var_cols[var].append(col)
-                            return i
+        # the closest wavelengths are the neighbours of the insert position
+        pos = bisect_left(candidates, (wvl, -1))
+        wvl_diff_min = 1e6
+        idx = None
+        for wvl_col, i in candidates[max(pos - 1, 0):pos + 1]:
+            if low <= wvl_col <= high:
+                diff = abs(wvl_col - wvl)
+                if diff < wvl_diff_min:
+                    wvl_diff_min = diff
+                    idx = i
+        if idx is not None:
+            self._alt_var_cols[var].add(cols[idx])
+            return idx
         raise VariableNotFoundError('Did not find an alternative data column '
                                     'for variable {} within allowed wavelength '
                                     'tolerance range of +/- {} nm.'
@@ -291,9 +446,112 @@ class ReadAeronetBase(ReadUngriddedBase):
     def print_all_columns(self):
         for col in self._last_col_order:
             print(col)
+    
+    def _get_read_opts(self, vars_available, meta_names):
+        """Get columns and dtypes required for reading the data block
+        
+        The result is cached based on the current header string (cf. 
+        :attr:`_last_col_index_str`) so that it is only computed once for 
+        all files that share the same header.
+        """
+        key = (self._last_col_index_str, tuple(meta_names), 
+               tuple(vars_available.items()))
+        try:
+            return self._read_opts_cache[key]
+        except KeyError:
+            pass
+        col_index = self.col_index
+        dtypes = {col_index['date'] : str, 
+                  col_index['time'] : str}
+        for idx in vars_available.values():
+            dtypes[idx] = np.float64
+        usecols = sorted(set(dtypes).union(col_index[m] for m in meta_names))
+        opts = (usecols, dtypes)
+        self._read_opts_cache[key] = opts
+        return opts
+    
+    def _read_data_block(self, in_file, vars_available, meta_names=None):
+        """Read data block of Aeronet file into numpy arrays
+        
+        Note
+        ----
+        The file needs to be opened and positioned at the first line of the
+        data block (i.e. after the header line).
+        
+        Parameters
+        ----------
+        in_file 
+            opened file object
+        vars_available : dict
+            variable names (keys) and corresponding column indices (values)
+            of data columns that are supposed to be read
+        meta_names : list, optional
+            names of metadata columns to be read (must be available in 
+            :attr:`col_index`). If None, :attr:`META_NAMES_FILE` is used.
+            
+        Returns
+        -------
+        dict
+            dictionary containing numpy arrays for timestamps (key dtime), 
+            each metadata key and each variable in ``vars_available``
+        """
+        if meta_names is None:
+            meta_names = self.META_NAMES_FILE
+        col_index = self.col_index
+        usecols, dtypes = self._get_read_opts(vars_available, meta_names)
+        try:
+            df = pd.read_csv(in_file, sep=self.COL_DELIM, header=None, 
+                             usecols=usecols, dtype=dtypes, 
+                             keep_default_na=False, engine='c')
+        except pd.errors.EmptyDataError:
+            df = pd.DataFrame(columns=usecols)
+        
+        result = {}
+        result['dtime'] = _parse_dtime(df[col_index['date']].values, 
+                                       df[col_index['time']].values)
+        
+        for item in meta_names:
+            vals = df[col_index[item]].values
+            if vals.dtype == object:
+                vals = vals.astype(str)
+            result[item] = vals
+            
+        for var, idx in vars_available.items():
+            vals = df[idx].values.astype(np.float64)
+            vals[vals == self.NAN_VAL] = np.nan
+            result[var] = vals
+        return result
+                
+    def _iter_read_files(self, files, vars_to_retrieve, multiproc=False):
+        """Generator that reads input files and yields results in order
+        
+        Parameters
+        ----------
+        files : list
+            list of files to be read
+        vars_to_retrieve : list
+            variables to be read
+        multiproc : bool
+            if True and if there are at least as many files as CPUs, the 
+            files are read in parallel using a pool of processes.
+            
+        Yields
+        ------
+        StationData
+            result of :func:`read_file` for each file
+        """
+        read_file = partial(self.read_file, vars_to_retrieve=vars_to_retrieve)
+        num_cpu = os.cpu_count() or 1
+        if multiproc and len(files) >= num_cpu > 1:
+            chunksize = max(1, len(files) // (num_cpu * 4))
+            with ProcessPoolExecutor() as executor:
+                yield from executor.map(read_file, files, chunksize=chunksize)
+        else:
+            for _file in files:
+                yield read_file(_file)
                 
     def read(self, vars_to_retrieve=None, files=None, first_file=None, 
-             last_file=None, file_pattern=None):
+             last_file=None, file_pattern=None, multiproc=False):
         """Method that reads list of files as instance of :class:`UngriddedData`
         
         Parameters
@@ -301,9 +559,11 @@ class ReadAeronetBase(ReadUngriddedBase):
         vars_to_retrieve : :obj:`list` or similar, optional,
             list containing variable IDs that are supposed to be read. If None, 
             all variables in :attr:`PROVIDES_VARIABLES` are loaded
-        files : :obj:`list`, optional
+        files : :obj:`list` or iterable, optional
             list of files to be read. If None, then the file list is used that
-            is returned on :func:`get_file_list`.
+            is returned on :func:`get_file_list`. May also be an iterator 
+            (e.g. from :func:`get_file_iter`), in which case only the files
+            between ``first_file`` and ``last_file`` are taken from it.
         first_file : :obj:`int`, optional
             index of first file in file list to read. If None, the very first
             file in the list is used. Note: is ignored if input parameter
@@ -314,6 +574,9 @@ class ReadAeronetBase(ReadUngriddedBase):
             `file_pattern` is specified.
         file_pattern : str, optional
             string pattern for file search (cf :func:`get_file_list`)
+        multiproc : bool
+            if True, the files are read in parallel using multiple processes
+            (cf. :func:`_iter_read_files`)
             
         Returns
         -------
@@ -331,18 +594,19 @@ class ReadAeronetBase(ReadUngriddedBase):
                 self.get_file_list(pattern=file_pattern)
             files = self.files
         
-        if file_pattern is None:
-            if first_file is None:
-                first_file = 0
-            if last_file is None:
-                last_file = len(files)
-            
-            files = files[first_file:last_file]
+        if file_pattern is None and not (first_file is None and 
+                                         last_file is None):
+            if isinstance(files, list):
+                files = files[first_file:last_file]
+            else:
+                files = list(islice(files, first_file, last_file))
+        elif not isinstance(files, list):
+            files = list(files)
         
         self.read_failed = []
         
         data_obj = UngriddedData()
-        meta_key = 0.0
+        meta_key = 0
         idx = 0
         
         #assign metadata object
@@ -351,77 +615,101 @@ class ReadAeronetBase(ReadUngriddedBase):
         
         num_vars = len(vars_to_retrieve)
         num_files = len(files)
+        
+        # constants used in file loop (metadata strings are shared by all
+        # stations)
+        data_id = sys.intern(self.DATA_ID)
+        ts_type = sys.intern(self.TS_TYPE)
+        default_instr = sys.intern(self.INSTRUMENT_NAME)
+        data_revision = self.data_revision
+        cls_name = type(self).__name__
+        _LATINDEX = data_obj._LATINDEX
+        _LONINDEX = data_obj._LONINDEX
+        _ALTITUDEINDEX = data_obj._ALTITUDEINDEX
+        _METADATAKEYINDEX = data_obj._METADATAKEYINDEX
+        _TIMEINDEX = data_obj._TIMEINDEX
+        _DATAINDEX = data_obj._DATAINDEX
+        _VARINDEX = data_obj._VARINDEX
+        var_indices = np.arange(num_vars)
+        
         disp_each = int(num_files*0.1)
         if disp_each < 1:
             disp_each = 1
         last_t = datetime.now()   
-        for i, _file in enumerate(files):
+        results = self._iter_read_files(files, vars_to_retrieve, multiproc)
+        for i, station_data in enumerate(results):
             
             if i%disp_each == 0:
                 last_t = _print_read_info(i, disp_each, num_files, 
-                                          last_t, type(self).__name__,
-                                          print_log)
-                print_log.info("Reading file {} of {} ({})".format(i, 
-                                 num_files, type(self).__name__))
-            station_data = self.read_file(_file, 
-                                          vars_to_retrieve=vars_to_retrieve)
+                                          last_t, cls_name, print_log)
+                print_log.info("Reading file %d of %d (%s)", i, num_files, 
+                               cls_name)
             # Fill the metatdata dict
             # the location in the data set is time step dependant!
             # use the lat location here since we have to choose one location
             # in the time series plot
-            meta = od()
-            meta['var_info'] = od()
+            meta = {}
+            meta['var_info'] = {}
             meta.update(station_data.get_meta())
             #metadata[meta_key].update(station_data.get_station_coords())
-            meta['data_id'] = self.DATA_ID
-            meta['ts_type'] = self.TS_TYPE
+            meta['data_id'] = data_id
+            meta['ts_type'] = ts_type
             meta['variables'] = vars_to_retrieve
-            if 'instrument_name' in station_data and station_data['instrument_name'] is not None:
-                instr = station_data['instrument_name']
-            else:
-                instr = self.INSTRUMENT_NAME
+            instr = station_data.get('instrument_name') or default_instr
             meta['instrument_name'] = instr
-            meta['data_revision'] = self.data_revision
+            meta['data_revision'] = data_revision
             # this is a list with indices of this station for each variable
             # not sure yet, if we really need that or if it speeds up things
-            meta_idx[meta_key] = od()
+            meta_idx[meta_key] = {}
             
             num_times = len(station_data['dtime'])
             
             #access array containing time stamps
             # TODO: check using index instead (even though not a problem here 
             # since all Aerocom data files are of type timeseries)
-            times = np.float64(station_data['dtime'])
+            # (read_file returns dtime as numpy array of dtype datetime64[s])
+            times = np.asarray(station_data['dtime'], dtype=np.float64)
             
             totnum = num_times * num_vars
             
+            if i == 0 and num_files > 1 and num_times > 0:
+                # estimate total size of data object from the sizes of all 
+                # files and the number of bytes per timestamp in first file, 
+                # to avoid repeated reallocation of the data array
+                sizes = [os.path.getsize(f) for f in files]
+                bytes_per_row = sizes[0] / num_times
+                est = int(1.1 * sum(sizes) / bytes_per_row) * num_vars
+                if est > data_obj._ROWNO:
+                    data_obj.add_chunk(est - data_obj._ROWNO)
+                    
             #check if size of data object needs to be extended
             if (idx + totnum) >= data_obj._ROWNO:
-                #if totnum < data_obj._CHUNKSIZE, then the latter is used
-                data_obj.add_chunk(totnum)
+                # double the size of the array (or add at least totnum rows)
+                data_obj.add_chunk(max(totnum, data_obj._ROWNO))
         
+            # block of data array that is filled with the data of this 
+            # station (view, i.e. data_obj._data is filled directly)
+            block = data_obj._data[idx:idx + totnum]
+            
+            #write common meta info for this station (data lon, lat and 
+            #altitude are set to station locations)
+            block[:, _LATINDEX] = station_data['latitude']
+            block[:, _LONINDEX] = station_data['longitude']
+            block[:, _ALTITUDEINDEX] = station_data['altitude']
+            block[:, _METADATAKEYINDEX] = meta_key
+            
+            # write data to data object (variables are stored one after
+            # another, each covering all timestamps)
+            block[:, _TIMEINDEX] = np.tile(times, num_vars)
+            block[:, _DATAINDEX] = np.concatenate(
+                    [station_data[var] for var in vars_to_retrieve])
+            block[:, _VARINDEX] = np.repeat(var_indices, num_times)
+            
             for var_idx, var in enumerate(vars_to_retrieve):
-                values = station_data[var]
                 start = idx + var_idx * num_times
                 stop = start + num_times
                 
-                #write common meta info for this station (data lon, lat and 
-                #altitude are set to station locations)
-                data_obj._data[start:stop, 
-                               data_obj._LATINDEX] = station_data['latitude']
-                data_obj._data[start:stop, 
-                               data_obj._LONINDEX] = station_data['latitude']
-                data_obj._data[start:stop, 
-                               data_obj._ALTITUDEINDEX] = station_data['altitude']
-                data_obj._data[start:stop, 
-                               data_obj._METADATAKEYINDEX] = meta_key
-                               
-                # write data to data object
-                data_obj._data[start:stop, data_obj._TIMEINDEX] = times
-                data_obj._data[start:stop, data_obj._DATAINDEX] = values
-                data_obj._data[start:stop, data_obj._VARINDEX] = var_idx
-                
-                meta_idx[meta_key][var] = np.arange(start, stop)
+                meta_idx[meta_key][var] = slice(start, stop)
                 
                 if var in station_data['var_info']:
                     if 'units' in station_data['var_info'][var]:
@@ -434,16 +722,22 @@ class ReadAeronetBase(ReadUngriddedBase):
                     u = self.UNITS[var]
                 else:
                     u = self.DEFAULT_UNIT
-                meta['var_info'][var] = od(units=u)
+                meta['var_info'][var] = dict(units=u)
                 if not var in data_obj.var_idx:
                     data_obj.var_idx[var] = var_idx
             
             idx += totnum  
             metadata[meta_key] = meta
-            meta_key = meta_key + 1.
+            meta_key += 1
         
-        # shorten data_obj._data to the right number of points
-        data_obj._data = data_obj._data[:idx]
+        # shorten data_obj._data to the right number of points. This is done
+        # in place (no copy), so any existing views of the array become 
+        # invalid. If the array does not own its data, a copy is made.
+        try:
+            data_obj._data.resize((idx, data_obj._data.shape[1]), 
+                                  refcheck=False)
+        except ValueError:
+            data_obj._data = data_obj._data[:idx].copy()
         #data_obj.data_revision[self.DATA_ID] = self.data_revision
         self.data = data_obj
         return data_obj
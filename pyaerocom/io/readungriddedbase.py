@@ -553,6 +553,29 @@ class ReadUngriddedBase(abc.ABC):
         self.files = files
         return files
     
+    def get_file_iter(self, pattern=None):
+        """Iterate over all files to be read without creating a list
+        
+        Same search as :func:`get_file_list`, but files are yielded lazily
+        and in arbitrary order (i.e. not sorted) and :attr:`files` is not
+        updated.
+        
+        Parameters
+        ----------
+        pattern : str, optional
+            file name pattern applied to search
+            
+        Yields
+        ------
+        str
+            file location
+        """
+        if isinstance(pattern, str):
+            pattern = (pattern + self._FILEMASK).replace('**', '*')
+        else:
+            pattern = self._FILEMASK
+        return glob.iglob(os.path.join(self.DATASET_PATH, pattern))
+    
     def read_station(self, station_id_filename, **kwargs):
         """Read data from a single station into :class:`UngriddedData`
         
@@ -9,6 +9,7 @@ import os
 import pytest
 from pyaerocom.test.settings import TEST_RTOL, lustre_unavail
 from pyaerocom.io.read_aeronet_sunv3 import ReadAeronetSunV3
+from pyaerocom.io.readaeronetbase import _parse_dtime
 
 
 TEST_VARS = ['od550aer', 'ang4487aer']
@@ -131,11 +132,40 @@ def test_load_berlin():
     nominal = [0.224297, 0.178662, 0.148119, 1.967039]
     npt.assert_allclose(actual=first_vals, desired=nominal, rtol=TEST_RTOL)
     
-    
-    
+def test__search_var_wavelength_tol():
+    from pyaerocom.exceptions import VariableNotFoundError
+    r = ReadAeronetSunV3()
+    cols = ['Date(dd:mm:yyyy)', 'AOD_508nm', 'AOD_497nm', 'AOD_490nm', 
+            'Precipitable_Water(cm)']
+    # the column closest to 500 nm is used, not the first one within 
+    # tolerance in header order
+    assert r._search_var_wavelength_tol('od500aer', cols) == 2
+    assert r._alt_var_cols['od500aer'] == {'AOD_497nm'}
+    
+    with pytest.raises(VariableNotFoundError):
+        r._search_var_wavelength_tol('od500aer', ['AOD_520nm', 'AOD_480nm'])
+
+def test__parse_dtime():
+    dtime = _parse_dtime(np.array(['29:02:2016', '31:12:2019']), 
+                         np.array(['00:00:00', '23:59:59']))
+    npt.assert_array_equal(dtime, 
+                           np.array(['2016-02-29T00:00:00', 
+                                     '2019-12-31T23:59:59'], 
+                                    dtype='datetime64[s]'))
+
+@pytest.mark.parametrize('date,time', [('29:02:2019', '00:00:00'),
+                                       ('00:01:2019', '00:00:00'),
+                                       ('01:13:2019', '00:00:00'),
+                                       ('01:01:2019', '24:00:00'),
+                                       ('01:01:2019', '00:60:00')])
+def test__parse_dtime_invalid(date, time):
+    with pytest.raises(ValueError):
+        _parse_dtime(np.array([date]), np.array([time]))
     
 if __name__=="__main__":
     
+    test__search_var_wavelength_tol()
+    test__parse_dtime()
     test_load_berlin()
     aeronetsunv3lev2_subset = make_dataset()
     test_shape_ungridded(aeronetsunv3lev2_subset)
\ No newline at end of file
@@ -144,6 +144,174 @@ def calc_statistics(data, ref_data, lowlim=None, highlim=None,
      
     return result
 
+def _rank_rows(arr):
+    """Rank data along rows of a 2D array, ties get average rank
+    
+    Row-wise equivalent of :func:`scipy.stats.rankdata` (method average).
+    
+    Parameters
+    ----------
+    arr : ndarray
+        2D array (must not contain NaNs)
+        
+    Returns
+    -------
+    ndarray
+        array of same shape containing the ranks (starting at 1) of the 
+        values within each row
+    """
+    num_rows, num_cols = arr.shape
+    order = np.argsort(arr, axis=1, kind='mergesort')
+    srt = np.take_along_axis(arr, order, axis=1)
+    # index of group of equal values, unique across all rows
+    new_val = np.ones(arr.shape, dtype=bool)
+    new_val[:, 1:] = srt[:, 1:] != srt[:, :-1]
+    groups = np.cumsum(new_val).reshape(arr.shape) - 1
+    pos = np.broadcast_to(np.arange(1, num_cols + 1, dtype=np.float64), 
+                          arr.shape)
+    avg = (np.bincount(groups.ravel(), weights=pos.ravel()) / 
+           np.bincount(groups.ravel()))
+    ranks = np.empty(arr.shape, dtype=np.float64)
+    np.put_along_axis(ranks, order, avg[groups], axis=1)
+    return ranks
+
+def calc_statistics_batch(data, ref_data, lowlim=None, highlim=None,
+                          min_num_valid=5):
+    """Calc statistical properties for multiple pairs of data arrays at once
+    
+    Vectorised version of :func:`calc_statistics` for 2-dimensional input
+    arrays, where each row is treated as one pair of 1-dimensional arrays 
+    (e.g. one station). The returned dictionary contains the same keys as 
+    the output of :func:`calc_statistics`, with values being arrays 
+    containing the results for each row. Statistical parameters that cannot
+    be computed for a row (e.g. due to too few valid data points) are NaN.
+    
+    Note
+    ----
+    Kendall rank correlation coefficients are computed row by row, using 
+    scipy.
+    
+    Parameters
+    ----------
+    data : ndarray
+        2D array containing data, that is supposed to be compared with 
+        reference data
+    ref_data : ndarray
+        2D array containing reference data (same shape as ``data``)
+    lowlim : float
+        lower end of considered value range (cf. :func:`calc_statistics`)
+    highlim : float
+        upper end of considered value range
+    min_num_valid : int
+        minimum number of valid measurements required to compute statistical
+        parameters.
+        
+    Returns
+    -------
+    dict
+        dictionary containing computed statistics (arrays of length number 
+        of rows)
+    
+    Raises
+    ------
+    ValueError 
+        if either of the input arrays has dimension other than 2 or if they 
+        have different shape
+    """
+    data = np.asarray(data, dtype=np.float64)
+    ref_data = np.asarray(ref_data, dtype=np.float64)
+    
+    if not data.ndim == 2 or not data.shape == ref_data.shape:
+        raise ValueError('Invalid input. Data arrays must be two dimensional '
+                         'and of same shape')
+    num_rows, num_cols = data.shape
+    result = {}
+    
+    mask = ~np.isnan(ref_data) & ~np.isnan(data)
+    num_points = mask.sum(axis=1)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # means and standard deviations are computed from all valid points
+        ref_mean = np.where(mask, ref_data, 0).sum(axis=1) / num_points
+        data_mean = np.where(mask, data, 0).sum(axis=1) / num_points
+        ref_std = np.sqrt(np.where(mask, (ref_data - ref_mean[:, None])**2, 
+                                   0).sum(axis=1) / num_points)
+        data_std = np.sqrt(np.where(mask, (data - data_mean[:, None])**2, 
+                                    0).sum(axis=1) / num_points)
+        
+        result['totnum'] = np.full(num_rows, float(num_cols))
+        result['num_valid'] = num_points.astype(np.float64)
+        result['refdata_mean'] = ref_mean
+        result['refdata_std'] = ref_std
+        result['data_mean'] = data_mean
+        result['data_std'] = data_std
+        
+        ok = num_points > min_num_valid
+        
+        if lowlim is not None:
+            mask = mask & (data > lowlim) & (ref_data > lowlim)
+        if highlim is not None:
+            mask = mask & (data < highlim) & (ref_data < highlim)
+        num = mask.sum(axis=1)
+        
+        difference = data - ref_data
+        
+        rms = np.sqrt(np.where(mask, difference**2, 0).sum(axis=1) / num)
+        
+        # Pearson correlation coefficient
+        d_mean = np.where(mask, data, 0).sum(axis=1) / num
+        r_mean = np.where(mask, ref_data, 0).sum(axis=1) / num
+        d_dev = np.where(mask, data - d_mean[:, None], 0)
+        r_dev = np.where(mask, ref_data - r_mean[:, None], 0)
+        R = ((d_dev * r_dev).sum(axis=1) / 
+             np.sqrt((d_dev**2).sum(axis=1) * (r_dev**2).sum(axis=1)))
+        
+        # NMB, MNMB and FGE are constrained to positive values, thus negative
+        # values need to be removed
+        neg_data = mask & (data < 0)
+        neg_ref = mask & (ref_data < 0)
+        pos = mask & ~neg_data & ~neg_ref
+        num_pos = pos.sum(axis=1)
+        
+        nmb = (np.where(pos, difference, 0).sum(axis=1) / 
+               np.where(pos, ref_data, 0).sum(axis=1))
+        tmp = np.where(pos, difference / (data + ref_data), 0)
+        mnmb = 2. / num_pos * tmp.sum(axis=1)
+        fge = 2. / num_pos * np.abs(tmp).sum(axis=1)
+        
+        no_pos = num_pos == 0
+        nmb[no_pos] = np.nan
+        mnmb[no_pos] = np.nan
+        fge[no_pos] = np.nan
+    
+        # Spearman correlation coefficient is Pearson correlation of ranks 
+        # (invalid points are ranked last and thus do not affect the ranks 
+        # of the valid ones)
+        d_rank = _rank_rows(np.where(mask, data, np.inf))
+        r_rank = _rank_rows(np.where(mask, ref_data, np.inf))
+        d_rdev = np.where(mask, d_rank - (num[:, None] + 1) / 2, 0)
+        r_rdev = np.where(mask, r_rank - (num[:, None] + 1) / 2, 0)
+        R_spearman = ((d_rdev * r_rdev).sum(axis=1) / 
+                      np.sqrt((d_rdev**2).sum(axis=1) * 
+                              (r_rdev**2).sum(axis=1)))
+        
+    R_kendall = np.full(num_rows, np.nan)
+    for i in np.where(ok)[0]:
+        m = mask[i]
+        R_kendall[i] = kendalltau(data[i][m], ref_data[i][m])[0]
+    
+    nan = np.full(num_rows, np.nan)
+    result['rms'] = np.where(ok, rms, nan)
+    result['R'] = np.where(ok, R, nan)
+    result['R_spearman'] = np.where(ok, R_spearman, nan)
+    result['R_kendall'] = R_kendall
+    result['nmb'] = np.where(ok, nmb, nan)
+    result['mnmb'] = np.where(ok, mnmb, nan)
+    result['fge'] = np.where(ok, fge, nan)
+    result['num_neg_data'] = np.where(ok, neg_data.sum(axis=1), nan)
+    result['num_neg_refdata'] = np.where(ok, neg_ref.sum(axis=1), nan)
+    return result
+
 def closest_index(num_array, value):
     """Returns index in number array that is closest to input value"""
     return np.argmin(np.abs(np.asarray(num_array) - value))
@@ -7,6 +7,8 @@ from os.path import join, exists
 from ast import literal_eval
 from collections import OrderedDict as od
 from configparser import ConfigParser
+from functools import lru_cache
+import numpy as np
 from pyaerocom import __dir__
 from pyaerocom._lowlevel_helpers import BrowseDict
 
@@ -113,12 +115,7 @@ class Region(BrowseDict):
             cannot be found in regions.ini file
         """
         name = name.upper()
-        fpath = join(__dir__, "data", "regions.ini")
-        if not exists(fpath):
-            raise IOError("Regions ini file could not be found: %s"
-                          %fpath)
-        conf_reader = ConfigParser()
-        conf_reader.read(fpath)
+        conf_reader = _read_regions_ini()
         if not name in conf_reader:
             raise AttributeError("No default region available for %s" %name)
         self._name = name
@@ -208,6 +205,27 @@ class Region(BrowseDict):
                self.lon_range_plot, self.lat_range_plot))
         return s
 
+@lru_cache(maxsize=None)
+def _read_regions_ini():
+    """Read regions.ini file (cached, the file is only parsed once)
+    
+    Note
+    ----
+    The returned object is shared and must not be modified.
+    
+    Raises
+    ------
+    IOError
+        if regions.ini file does not exist
+    """
+    fpath = join(__dir__, "data", "regions.ini")
+    if not exists(fpath):
+        raise IOError("Regions ini file could not be found: %s"
+                      %fpath)
+    conf_reader = ConfigParser()
+    conf_reader.read(fpath)
+    return conf_reader
+
 def all():
     """Wrapper for :func:`get_all_default_region_ids`"""
     return get_all_default_region_ids()
@@ -221,12 +239,7 @@ def get_all_default_region_ids():
         all default region IDs (sections in `regions.ini <https://github.com/
         metno/pyaerocom/blob/master/pyaerocom/data/regions.ini>`__ file)
     """
-    fpath = join(__dir__, "data", "regions.ini")
-    if not exists(fpath):
-        raise IOError("File conventions ini file could not be found: %s"
-                      %fpath)
-    conf_reader = ConfigParser()
-    conf_reader.read(fpath)
+    conf_reader = _read_regions_ini()
     all_ids = []
     for rid, region in conf_reader.items():
         if not rid == "DEFAULT":
@@ -250,12 +263,7 @@ def get_all_default_regions():
         master/pyaerocom/data/regions.ini>`__ file
         
     """
-    fpath = join(__dir__, "data", "regions.ini")
-    if not exists(fpath):
-        raise IOError("File conventions ini file could not be found: %s"
-                      %fpath)
-    conf_reader = ConfigParser()
-    conf_reader.read(fpath)
+    conf_reader = _read_regions_ini()
     all_regions = od()
     for region in conf_reader:
         if not region == "DEFAULT":
@@ -333,6 +341,51 @@ def find_closest_region_coord(lat, lon, **add_regions):
                 best=rname
         return best
 
+def find_closest_region_coords(lats, lons):
+    """Vectorised version of :func:`find_closest_region_coord`
+
+    Assigns one default region to each input coordinate. Each coordinate is
+    tested against the lat / lon bounding boxes of all default regions at
+    once. If more than one region contains a coordinate, the one with the
+    closest center (haversine distance) is chosen. Coordinates that are not
+    contained in any region are assigned to WORLD.
+
+    Parameters
+    ----------
+    lats : array-like
+        latitudes of coordinates
+    lons : array-like
+        longitudes of coordinates
+
+    Returns
+    -------
+    list
+        names of regions, one for each input coordinate
+    """
+    from pyaerocom.geodesy import haversine
+    lats = np.asarray(lats, dtype=np.float64).reshape(-1, 1)
+    lons = np.asarray(lons, dtype=np.float64).reshape(-1, 1)
+    regs = [(name, reg) for name, reg in get_all_default_regions().items()
+            if not name == 'WORLD']
+    if len(regs) == 0 or len(lats) == 0:
+        return ['WORLD'] * len(lats)
+    names = np.asarray([name for name, _ in regs] + ['WORLD'])
+    lat_rng = np.asarray([reg.lat_range for _, reg in regs], dtype=np.float64)
+    lon_rng = np.asarray([reg.lon_range for _, reg in regs], dtype=np.float64)
+
+    # (num_coords, num_regions) mask
+    inside = ((lat_rng[:, 0] <= lats) & (lats <= lat_rng[:, 1]) &
+              (lon_rng[:, 0] <= lons) & (lons <= lon_rng[:, 1]))
+
+    latc = lat_rng[:, 0] + (lat_rng[:, 1] - lat_rng[:, 0]) / 2
+    lonc = lon_rng[:, 0] + (lon_rng[:, 1] - lon_rng[:, 0]) / 2
+    dists = np.where(inside, haversine(latc, lonc, lats, lons), np.inf)
+
+    idx = np.argmin(dists, axis=1)
+    # coordinates not contained in any region
+    idx[~inside.any(axis=1)] = len(regs)
+    return names[idx].tolist()
+
 def valid_region(name):
     """Boolean specifying whether input region is valid or not"""
     if isinstance(name, str):
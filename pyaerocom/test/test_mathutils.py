@@ -4,6 +4,7 @@
 Tests for _lowlevel_helpers.py module of pyaerocom
 """
 
+import numpy as np
 import numpy.testing as npt
 import pyaerocom.mathutils as utils
 
@@ -14,8 +15,25 @@ def test_exponent():
             utils.exponent(4),
             utils.exponent(234)]
     npt.assert_array_equal(nominal, vals)
+
+def test_calc_statistics_batch():
+    """Test :func:`calc_statistics_batch` against :func:`calc_statistics`"""
+    rs = np.random.RandomState(42)
+    data = rs.rand(4, 20)
+    ref = rs.rand(4, 20) - 0.1
+    data[1, :5] = np.nan
+    ref[2, 3:] = np.nan
+    # ties (relevant for rank correlation)
+    data[3] = np.round(data[3] * 3)
+    ref[3, ::2] = 0.5
+    batch = utils.calc_statistics_batch(data, ref)
+    for i in range(4):
+        stats = utils.calc_statistics(data[i], ref[i])
+        for key, val in stats.items():
+            npt.assert_allclose(batch[key][i], val)
     
 if __name__ == '__main__':
     test_exponent()
+    test_calc_statistics_batch()
     
     
\ No newline at end of file
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for region.py module of pyaerocom
+"""
+import numpy as np
+import numpy.testing as npt
+from pyaerocom import region
+
+def test_find_closest_region_coords():
+    """Test :func:`find_closest_region_coords` against scalar version"""
+    lats, lons = np.meshgrid(np.arange(-85, 90, 10), np.arange(-175, 180, 10))
+    lats, lons = lats.ravel(), lons.ravel()
+    nominal = [region.find_closest_region_coord(lat, lon)
+               for lat, lon in zip(lats, lons)]
+    vals = region.find_closest_region_coords(lats, lons)
+    npt.assert_array_equal(vals, nominal)
+    # grid includes coordinates outside all regions and in overlapping regions
+    assert 'WORLD' in vals
+    assert sum(len(region.get_regions_coord(lat, lon)) > 1
+               for lat, lon in zip(lats, lons)) > 0
+
+def test_find_closest_region_coords_special_cases():
+    # outside all regions, in ASIA and INDIA, in ASIA and CHINA, on border
+    lats = [-80, 25, 30, 30]
+    lons = [0, 80, 110, -20]
+    nominal = [region.find_closest_region_coord(lat, lon)
+               for lat, lon in zip(lats, lons)]
+    assert nominal[0] == 'WORLD'
+    assert region.find_closest_region_coords(lats, lons) == nominal
+
+def test_find_closest_region_coords_empty():
+    assert region.find_closest_region_coords([], []) == []
+
+if __name__=="__main__":
+    test_find_closest_region_coords()
+    test_find_closest_region_coords_special_cases()
+    test_find_closest_region_coords_empty()
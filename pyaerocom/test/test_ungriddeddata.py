@@ -60,10 +60,102 @@ def test_coordinate_access():
     npt.assert_array_equal(c['longitude'], lons)
     npt.assert_array_equal(c['altitude'], alts)
     
+def _make_ungridded_slice_index(data_id='testcase', num_stats=3, 
+                                num_times=10):
+    """Create UngriddedData object with slices in meta_idx
+    
+    Layout like in reading class for Aeronet (cf. readaeronetbase.py), i.e.
+    one block of rows per station and variables stored one after another.
+    Data values are 100*station index + 50*variable index + time index.
+    """
+    var_names = ['od550aer', 'ang4487aer']
+    num_vars = len(var_names)
+    d = UngriddedData(num_points=num_stats*num_vars*num_times)
+    times = (np.datetime64('2010-01-01', 's') + 
+             np.arange(num_times) * np.timedelta64(1, 'D')).astype(np.float64)
+    idx = 0
+    for i in range(num_stats):
+        meta_key = float(i)
+        d.metadata[meta_key] = dict(data_id=data_id, 
+                                    station_name='stat{}'.format(i),
+                                    latitude=10.0 * i,
+                                    longitude=20.0 * i,
+                                    altitude=100.0 * i,
+                                    ts_type='daily',
+                                    variables=var_names,
+                                    var_info={v : {} for v in var_names})
+        d.meta_idx[meta_key] = {}
+        for var_idx, var in enumerate(var_names):
+            sl = slice(idx, idx + num_times)
+            block = d._data[sl]
+            block[:, d._METADATAKEYINDEX] = meta_key
+            block[:, d._TIMEINDEX] = times
+            block[:, d._LATINDEX] = 10.0 * i
+            block[:, d._LONINDEX] = 20.0 * i
+            block[:, d._ALTITUDEINDEX] = 100.0 * i
+            block[:, d._VARINDEX] = var_idx
+            block[:, d._DATAINDEX] = 100*i + 50*var_idx + np.arange(num_times)
+            d.meta_idx[meta_key][var] = sl
+            d.var_idx[var] = var_idx
+            idx += num_times
+    return d
+
+def test_slice_index_check():
+    d = _make_ungridded_slice_index()
+    d._check_index()
+    assert isinstance(d.meta_idx[1.0]['od550aer'], slice)
+
+def test_slice_index_to_station_data():
+    d = _make_ungridded_slice_index()
+    stat = d.to_station_data(1.0, 'ang4487aer')
+    npt.assert_array_equal(stat['ang4487aer'].values, 150 + np.arange(10))
+    
+    stat = d.to_station_data('stat2', 'od550aer')
+    npt.assert_array_equal(stat['od550aer'].values, 200 + np.arange(10))
+
+def test_slice_index_filter_by_meta():
+    d = _make_ungridded_slice_index()
+    f = d.filter_by_meta(station_name='stat1')
+    f._check_index()
+    assert len(f.metadata) == 1
+    npt.assert_array_equal(f.shape, (20, d.shape[1]))
+    vals = f._data[f.meta_idx[0.0]['ang4487aer'], f._DATAINDEX]
+    npt.assert_array_equal(vals, 150 + np.arange(10))
+
+def test_slice_index_merge():
+    d1 = _make_ungridded_slice_index()
+    d2 = _make_ungridded_slice_index(num_stats=2)
+    merged = d1.merge(d2, new_obj=True)
+    merged._check_index()
+    assert len(merged.metadata) == 5
+    npt.assert_array_equal(merged.shape, (100, d1.shape[1]))
+    # meta indices of 2nd object are offset by number of stations in 1st and
+    # data indices by number of rows in 1st
+    idx = merged.meta_idx[4.0]['od550aer']
+    npt.assert_array_equal(idx, np.arange(80, 90))
+    stat = merged.to_station_data(4.0, 'od550aer')
+    npt.assert_array_equal(stat['od550aer'].values, 100 + np.arange(10))
+    # first object is unchanged
+    assert isinstance(d1.meta_idx[2.0]['od550aer'], slice)
+    npt.assert_array_equal(d1.shape, (60, merged.shape[1]))
+
+def test_slice_index_find_common_data_points():
+    d1 = _make_ungridded_slice_index()
+    d2 = _make_ungridded_slice_index(num_stats=2)
+    dates, vals1, vals2 = d1.find_common_data_points(d2, 'ang4487aer')
+    assert len(dates) == 20
+    npt.assert_array_equal(vals1, vals2)
+    npt.assert_array_equal(vals1[10:], 150 + np.arange(10))
+    
 @lustre_unavail
 def test_check_index_aeronet_subset(aeronetsunv3lev2_subset):
     aeronetsunv3lev2_subset._check_index()
     
 if __name__=="__main__":
     test_init_shape()
-    test_coordinate_access()
\ No newline at end of file
+    test_coordinate_access()
+    test_slice_index_check()
+    test_slice_index_to_station_data()
+    test_slice_index_filter_by_meta()
+    test_slice_index_merge()
+    test_slice_index_find_common_data_points()
\ No newline at end of file
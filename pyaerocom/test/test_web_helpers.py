@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for helper methods in web/helpers.py module of pyaerocom
+"""
+import os
+import json
+import numpy as np
+import pytest
+from pyaerocom.web import helpers
+
+def test_json_array_writer(tmpdir):
+    fp = str(tmpdir.join('test.json'))
+    with helpers.json_array_writer(fp) as add:
+        for i in range(3):
+            add({'index' : i})
+    with open(fp) as f:
+        assert json.load(f) == [{'index' : 0}, {'index' : 1}, {'index' : 2}]
+    assert os.listdir(str(tmpdir)) == ['test.json']
+
+def test_json_array_writer_empty(tmpdir):
+    fp = str(tmpdir.join('test.json'))
+    with helpers.json_array_writer(fp):
+        pass
+    with open(fp) as f:
+        assert json.load(f) == []
+
+def test_json_array_writer_error(tmpdir):
+    fp = str(tmpdir.join('test.json'))
+    with open(fp, 'w') as f:
+        f.write('["old"]')
+    with pytest.raises(ValueError):
+        with helpers.json_array_writer(fp) as add:
+            add({'index' : 0})
+            raise ValueError('test')
+    # target is untouched and no temporary file is left
+    with open(fp) as f:
+        assert json.load(f) == ['old']
+    assert os.listdir(str(tmpdir)) == ['test.json']
+
+def test_iter_files(tmpdir):
+    tmpdir.join('a.json').write('')
+    tmpdir.join('b.txt').write('')
+    tmpdir.join('.hidden.json').write('')
+    tmpdir.mkdir('sub').join('c.json').write('')
+    root = str(tmpdir)
+
+    files = sorted(os.path.basename(f)
+                   for f in helpers.iter_files(root, '*.json'))
+    assert files == ['a.json']
+
+    files = sorted(os.path.basename(f)
+                   for f in helpers.iter_files(root, '*.json',
+                                               recursive=True))
+    assert files == ['a.json', 'c.json']
+
+def test_iter_files_missing_dir(tmpdir):
+    root = str(tmpdir.join('does_not_exist'))
+    assert list(helpers.iter_files(root, '*.json')) == []
+
+def test_nan_to_none():
+    vals = helpers.nan_to_none(np.array([1, np.nan, 2.5, np.inf]))
+    assert vals == [1.0, None, 2.5, None]
+    assert json.dumps(vals) == '[1.0, null, 2.5, null]'
+
+@pytest.mark.parametrize('orjson_available', [True, False])
+def test__dumps_compact(monkeypatch, orjson_available):
+    if orjson_available and not helpers.ORJSON_AVAILABLE:
+        pytest.skip('orjson is not installed')
+    monkeypatch.setattr(helpers, 'ORJSON_AVAILABLE', orjson_available)
+    data = {'a' : [1.5, float('nan')], 'b' : None}
+    assert json.loads(helpers._dumps_compact(data)) == {'a' : [1.5, None],
+                                                        'b' : None}
+    # NaN free data (written using standard library json without orjson)
+    assert json.loads(helpers._dumps_compact({'a' : [1, 2]})) == {'a' : [1, 2]}
+
+if __name__=="__main__":
+    pytest.main([__file__])
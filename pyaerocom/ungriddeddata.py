@@ -63,7 +63,8 @@ class UngriddedData(object):
         correspond to metadata key (float -> station, see :attr:`metadata`) and 
         values are dictionaries containing keys specifying variable name and 
         corresponding values are arrays or lists, specifying indices (rows) of 
-        these station / variable information in :attr:`_data`.
+        these station / variable information in :attr:`_data`. Contiguous 
+        blocks of rows may also be specified as :class:`slice`.
     var_idx : dict
         mapping of variable name (keys, e.g. od550aer) to numerical variable 
         index of this variable in data numpy array (in column specified by
@@ -179,7 +180,7 @@ class UngriddedData(object):
                     
             var_idx = self.meta_idx[idx]
             for var, indices in var_idx.items():
-                if len(indices) == 0:
+                if _num_indices(indices) == 0:
                     continue # no data assigned for this metadata index
                 
                 assert var in meta['variables'] or var in meta['var_info'], \
@@ -1200,7 +1201,7 @@ class UngriddedData(object):
             if self._check_filter_match(meta, *filters):
                 meta_matches.append(meta_idx)
                 for var in meta['variables']:
-                    totnum += len(self.meta_idx[meta_idx][var])
+                    totnum += _num_indices(self.meta_idx[meta_idx][var])
                 
         return (meta_matches, totnum)
        
@@ -1329,7 +1330,7 @@ class UngriddedData(object):
             new.meta_idx[meta_idx_new] = od()
             for var in meta['variables']:
                 indices = self.meta_idx[meta_idx][var]
-                totnum = len(indices)
+                totnum = _num_indices(indices)
 
                 stop = data_idx_new + totnum
                 
@@ -1461,7 +1462,7 @@ class UngriddedData(object):
         arr_idx = 0
         
         for midx, didx in self.meta_idx.items():
-            if var_name in didx and len(didx[var_name]) > 0:
+            if var_name in didx and _num_indices(didx[var_name]) > 0:
                 meta_idx += 1
                 meta =  {}
                 _meta = self.metadata[midx]
@@ -1475,7 +1476,7 @@ class UngriddedData(object):
             
                 subset.meta_idx[meta_idx] = {}
                 
-                num_add = len(idx)
+                num_add = _num_indices(idx)
                 start = arr_idx
                 stop = arr_idx + num_add
                 subset.meta_idx[meta_idx][var_name] = np.arange(start, stop)
@@ -1660,7 +1661,7 @@ class UngriddedData(object):
                            
                 data_var_idx = self.meta_idx[meta_idx]
                 for var, data_idx in data_var_idx.items():
-                    num = len(data_idx)
+                    num = _num_indices(data_idx)
                     stop = didx + num
                     new._data[didx:stop, :] = self._data[data_idx]
                     new._data[didx:stop, 0] = i
@@ -1729,7 +1730,7 @@ class UngriddedData(object):
                 obj.metadata[meta_idx] = meta_other
                 _idx_map = od()
                 for var_name, indices in other.meta_idx[meta_idx_other].items():
-                    _idx_map[var_name] = np.asarray(indices) + data_offset
+                    _idx_map[var_name] = _index_array(indices) + data_offset
                 obj.meta_idx[meta_idx] = _idx_map
             
             for var, idx in other.var_idx.items():
@@ -2434,6 +2435,29 @@ class UngriddedData(object):
                                'Error: {}'.format(repr(e)))
                 return out_data
     
+def _index_array(indices):
+    """Convert data indices of a :attr:`UngriddedData.meta_idx` entry to array
+    
+    Parameters
+    ----------
+    indices : :obj:`slice` or array-like
+        row indices in data array
+        
+    Returns
+    -------
+    ndarray
+        array containing row indices
+    """
+    if isinstance(indices, slice):
+        return np.arange(indices.start, indices.stop)
+    return np.asarray(indices)
+
+def _num_indices(indices):
+    """Number of data rows of a :attr:`UngriddedData.meta_idx` entry"""
+    if isinstance(indices, slice):
+        return indices.stop - indices.start
+    return len(indices)
+
 def reduce_array_closest(arr_nominal, arr_to_be_reduced):
     test = sorted(arr_to_be_reduced)
     closest_idx = []
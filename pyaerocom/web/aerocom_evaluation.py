@@ -1,30 +1,244 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-from fnmatch import fnmatch
-import glob
+from fnmatch import fnmatch, translate
+import hashlib
+import importlib
 import os
+import re
+import sys
+import tempfile
+from functools import lru_cache
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
+import pandas as pd
 import simplejson
+import xarray
 
 # internal pyaerocom imports
-from pyaerocom._lowlevel_helpers import (check_dirs_exist, dict_to_str)
+from pyaerocom._lowlevel_helpers import (check_dirs_exist, 
+                                        _dict_to_str_parts)
 from pyaerocom import const
 from pyaerocom import __version__ as pyaerocom_version
-from pyaerocom.mathutils import calc_statistics
+from pyaerocom.mathutils import calc_statistics, calc_statistics_batch
 from pyaerocom.region import (get_all_default_region_ids, 
-                              find_closest_region_coord,
+                              find_closest_region_coords,
                               Region)
 from pyaerocom.io.helpers import save_dict_json
 
 from pyaerocom.web.helpers import (ObsConfigEval, ModelConfigEval, 
                                    update_menu_evaluation_iface, 
                                    make_info_table_evaluation_iface, 
-                                   read_json, write_json)
+                                   read_json, write_json, 
+                                   write_json_compact, write_json_indent2,
+                                   json_array_writer,
+                                   iter_files, nan_to_none,
+                                   delete_experiment_data_evaluation_iface,
+                                   ORJSON_AVAILABLE)
 from pyaerocom import ColocationSetup, ColocatedData, Colocator
 
 from pyaerocom.web.obs_config_default import OBS_SOURCES, OBS_DEFAULTS
 from pyaerocom.exceptions import DataDimensionError
 
+#: Regular expression for names of json map files (cf. 
+#: :func:`AerocomEvaluation.get_json_mapname`), groups are obs name, obs var,
+#: vertical code, model name and model var
+_MAP_FILE_RE = re.compile(r'^OBS-([^:_]+):([^_]+)_([^_]+)_MOD-([^:]+):'
+                          r'([^:]+)\.json$')
+
+#: Regular expression for names of resample cache files (cf. 
+#: :func:`AerocomEvaluation._get_resample_cache_file`) and temporary files 
+#: written in :func:`AerocomEvaluation._write_resample_cache`
+_RESAMPLE_CACHE_FILE_RE = re.compile(r'^([0-9a-f]{40}|tmp_\w+)\.nc$')
+
+def _find_matches(names, name_or_pattern):
+    """Find names that match input search pattern(s)
+    
+    Helper for :func:`AerocomEvaluation.find_model_matches` and
+    :func:`AerocomEvaluation.find_obs_matches`. Each pattern is translated
+    into a regular expression (case-sensitive, cf. 
+    :func:`fnmatch.fnmatchcase`), compiled expressions are cached across 
+    calls (cf. :func:`_compile_pattern`).
+    
+    Parameters
+    ----------
+    names : dict
+        dictionary whose keys are the available names (e.g. model config)
+    name_or_pattern : :obj:`str`, or :obj:`list`
+        name(s) or pattern(s) to search for
+    
+    Returns
+    -------
+    list
+        names that match, in order of input patterns
+    """
+    if isinstance(name_or_pattern, str):
+        name_or_pattern = [name_or_pattern]
+    matches, found = [], set()
+    for search_pattern in name_or_pattern:
+        if not any(c in search_pattern for c in '*?['):
+            # literal name, no pattern matching required
+            if search_pattern in names and search_pattern not in found:
+                matches.append(search_pattern)
+                found.add(search_pattern)
+            continue
+        regex = _compile_pattern(search_pattern)
+        for name in names:
+            if name not in found and regex.match(name):
+                matches.append(name)
+                found.add(name)
+    return matches
+
+@lru_cache(maxsize=128)
+def _compile_pattern(pattern):
+    """Compiled regular expression for input fnmatch pattern (cached)"""
+    return re.compile(translate(pattern))
+
+@lru_cache(maxsize=None)
+def _cached_region(name):
+    """Cached default region (must not be modified)"""
+    return Region(name)
+
+@lru_cache(maxsize=4096)
+def _stationfile_name(station_name, obs_name, obs_var, vert_code):
+    """Cached helper for :func:`AerocomEvaluation.get_stationfile_name`"""
+    return ('{}_OBS-{}:{}_{}.json'
+            .format(station_name, obs_name, obs_var, vert_code))
+
+@lru_cache(maxsize=4096)
+def _json_mapname(obs_name, obs_var, model_name, model_var, vert_code):
+    """Cached helper for :func:`AerocomEvaluation.get_json_mapname`"""
+    return ('OBS-{}:{}_{}_MOD-{}:{}.json'
+            .format(obs_name, obs_var, vert_code, model_name, model_var))
+
+def _to_jsdate(timestamps):
+    """Convert numpy datetime64 array into javascript timestamps
+    
+    Parameters
+    ----------
+    timestamps : ndarray
+        array of numpy datetime64 timestamps
+        
+    Returns
+    -------
+    ndarray or list
+        milliseconds since 1970 (int64), either as numpy array (if orjson is
+        available, which can serialise it directly), else as list. The 
+        returned object is shared by all stations.
+    """
+    js = timestamps.astype('datetime64[s]').astype(np.int64) * 1000
+    if ORJSON_AVAILABLE:
+        return js
+    return js.tolist()
+
+def _process_station(obs_vals, mod_vals, jsdate):
+    """Compute timeseries data for one station
+    
+    Helper for :func:`AerocomEvaluation.compute_json_files_from_colocateddata`
+    that only operates on numpy arrays.
+    
+    Parameters
+    ----------
+    obs_vals : dict
+        observation data (1D arrays or None) for each output frequency
+    mod_vals : dict
+        corresponding model data
+    jsdate : dict
+        timestamps (ms since 1970) for each output frequency
+        
+    Returns
+    -------
+    tuple
+        3-element tuple containing timeseries data (dict), list of 
+        frequencies for which data is available and a message string to be
+        appended to the log output
+    """
+    ts_vals = {}
+    freqs_avail = []
+    msg = ''
+    for tres, obs in obs_vals.items():
+        if obs is None or all(np.isnan(obs)):
+            if obs is not None:
+                msg += ': No obs data'
+            ts_vals['{}_date'.format(tres)] = []
+            ts_vals['{}_obs'.format(tres)] = []
+            ts_vals['{}_mod'.format(tres)] = []
+            continue
+        freqs_avail.append(tres)
+        mod = mod_vals[tres]
+        
+        if not len(jsdate[tres]) == obs.size:
+            raise Exception('Please debug...')
+        
+        ts_vals['{}_date'.format(tres)] = jsdate[tres]
+        if ORJSON_AVAILABLE: # numpy arrays are serialised directly
+            ts_vals['{}_obs'.format(tres)] = obs
+            ts_vals['{}_mod'.format(tres)] = mod
+        else:
+            ts_vals['{}_obs'.format(tres)] = nan_to_none(obs)
+            ts_vals['{}_mod'.format(tres)] = nan_to_none(mod)
+    return (ts_vals, freqs_avail, msg)
+
+def _make_json_files_worker(evaluation, file, obs_name, model_name):
+    """Compute json files for one colocated data file in a worker process
+    
+    Helper for :func:`AerocomEvaluation.make_json_files`. Map and scatter 
+    json files are written directly, since they are specific for each file.
+    Data for the shared station and heatmap json files is returned, so that 
+    it can be written in the main process.
+    
+    Returns
+    -------
+    tuple
+        2-element tuple containing station timeseries data of this model 
+        (dict, file path -> {model_name : data}) and list of input arguments
+        for :func:`AerocomEvaluation._write_heatmap_json`
+    """
+    heatmap_args = []
+    d = ColocatedData(file)
+    evaluation.compute_json_files_from_colocateddata(d, obs_name, model_name,
+                                                     source_file=file,
+                                                     heatmap_buffer=heatmap_args)
+    return (_get_station_data_model(evaluation, model_name), heatmap_args)
+
+def _get_station_data_model(evaluation, model_name):
+    """Get cached station timeseries data of one model"""
+    station_data = {}
+    for fp, data in evaluation._station_cache.items():
+        if model_name in data:
+            station_data[fp] = {model_name : data[model_name]}
+    return station_data
+
+def _run_evaluation_worker(evaluation, obs_name, model_name, var_name, 
+                           only_colocation):
+    """Run colocation and json computation for one obs / model combination
+    
+    Helper for :func:`AerocomEvaluation._run_models_parallel`. Colocated 
+    data files, map and scatter json files are written directly. Data for the 
+    shared station and heatmap json files is returned, so that it can be 
+    written in the main process.
+    
+    Returns
+    -------
+    tuple
+        3-element tuple containing list of converted colocated data files,
+        station timeseries data of this model (dict, file path -> 
+        {model_name : data}) and list of input arguments for 
+        :func:`AerocomEvaluation._write_heatmap_json`
+    """
+    # avoid nested process pools
+    evaluation.num_proc_files = None
+    col = evaluation.run_colocation(model_name, obs_name, var_name)
+    if only_colocation:
+        return ([], {}, [])
+    heatmap_args = []
+    converted = evaluation.make_json_files(model_name, obs_name, var_name,
+                                           colocator=col, 
+                                           flush_station_cache=False,
+                                           heatmap_buffer=heatmap_args)
+    return (converted, _get_station_data_model(evaluation, model_name), 
+            heatmap_args)
+
 # ToDo: complete docstring
 class AerocomEvaluation(object):
     """Class for creating json files for Aerocom Evaluation interface
@@ -122,16 +336,16 @@ class AerocomEvaluation(object):
         dictionary containing configuration details for individual observations
         (i.e. instances of :class:`ObsConfigEval` for each observation) used 
         for the analysis.
-    obs_ignore : list, optional
-        list of observations that are supposed to be ignored in analysis 
-        (keys from :attr:`obs_config`)
+    obs_ignore : frozenset
+        observations that are supposed to be ignored in analysis (keys from 
+        :attr:`obs_config`, may be assigned as list)
     model_config : dict
         dictionary containing configuration details for individual models
         (i.e. instances of :class:`ModelConfigEval` for each model) used 
         for the analysis.
-    model_ignore : list, optional
-        list of models that are supposed to be ignored in analysis 
-        (keys from :attr:`model_config`)
+    model_ignore : frozenset
+        models that are supposed to be ignored in analysis (keys from 
+        :attr:`model_config`, may be assigned as list)
     var_mapping : dict
         mapping of variable names for menu in interface
     var_order_menu : list, optional
@@ -153,7 +367,11 @@ class AerocomEvaluation(object):
     VERT_SCHEMES = {'Surface' : 'surface'}
     
     #: Attributes that are ignored when writing setup to json file
-    JSON_CFG_IGNORE = ['add_methods', '_log', 'out_dirs']
+    JSON_CFG_IGNORE = frozenset(['add_methods', '_log', 'out_dirs', 
+                                 '_station_cache', '_obs_name_index', 
+                                 '_model_name_index', '_vert_code_cache', 
+                                 '_stack_cache', '_model_cfg_cache', 
+                                 '_fun_cache'])
     
     _OPTS_NAMES_OUTPUT = {
             'clear_existing_json' : 'Delete existing json files before reanalysis',
@@ -167,6 +385,21 @@ class AerocomEvaluation(object):
         
         self._log = const.print_log
         
+        # reverse lookup tables for find_obs_name and find_model_name (built
+        # on demand, reset whenever obs or model config is changed)
+        self._obs_name_index = None
+        self._model_name_index = None
+        # vertical codes for (obs_name, obs_var), reset with obs config
+        self._vert_code_cache = {}
+        # stacked lat / lon indices for gridded colocated data
+        self._stack_cache = {}
+        # output of get_model_config for each model (reset together with 
+        # custom read methods)
+        self._model_cfg_cache = {}
+        # custom read methods resolved in get_custom_read_method_model (reset
+        # together with custom read methods)
+        self._fun_cache = {}
+        
         self.proj_id = proj_id
         
         self.exp_id = exp_id
@@ -177,6 +410,15 @@ class AerocomEvaluation(object):
         
         self.only_colocation = False
         
+        #: Number of processes used for computation of json files from 
+        #: multiple colocated data files in :func:`make_json_files` (None or 
+        #: 1: serial)
+        self.num_proc_files = None
+        
+        #: Number of processes used for running the models of each 
+        #: observation network in :func:`run_evaluation` (None or 1: serial)
+        self.num_proc_runs = None
+        
         #: Base directory for output
         self.out_basedir = None
         
@@ -195,16 +437,20 @@ class AerocomEvaluation(object):
         
         #: Dictionary containing configurations for observations
         self.obs_config = {}
-        self.obs_ignore = []
+        self.obs_ignore = frozenset()
         
         #: Dictionary containing configurations for models
         self.model_config = {}
-        self.model_ignore = []
+        self.model_ignore = frozenset()
         
         self.var_mapping = {}
         self.var_order_menu = []
         
         self._valid_obs_vars = {}
+        
+        # station timeseries data (json file path -> content), written in
+        # flush_station_cache
+        self._station_cache = {}
         if try_load_json and proj_id is not None:
             try:
                 self.load_config(self.proj_id, self.exp_id, config_dir)
@@ -259,6 +505,8 @@ class AerocomEvaluation(object):
         return os.listdir(self.out_dirs['map'])
     
     def _update_custom_read_methods(self):
+        self._model_cfg_cache = {}
+        self._fun_cache = {}
         for mcfg in self.model_config.values():
             if not 'model_read_aux' in mcfg:
                 continue
@@ -280,7 +528,7 @@ class AerocomEvaluation(object):
                     raise ValueError('Names of custom methods need to be strings')
                     
                 name = varcfg['fun']
-                fun = self.get_custom_read_method_model(name)
+                fun = self._get_custom_read_method_cached(name)
                 if not name in self.add_methods:
                     self.add_methods[name] = fun
                 
@@ -306,7 +554,6 @@ class AerocomEvaluation(object):
         if method_name in self.add_methods:
             fun = self.add_methods[method_name]
         else:
-            import sys, importlib
             fp = self.add_methods_file
             
             if fp is None or not os.path.exists(fp):
@@ -334,6 +581,15 @@ class AerocomEvaluation(object):
             raise TypeError('{} ({}) is not a callable object'.format(fun, 
                             method_name))
         return fun
+    
+    def _get_custom_read_method_cached(self, method_name):
+        """Cached version of :func:`get_custom_read_method_model`"""
+        try:
+            return self._fun_cache[method_name]
+        except KeyError:
+            fun = self.get_custom_read_method_model(method_name)
+            self._fun_cache[method_name] = fun
+            return fun
         
     def update(self, **settings):
         """Update current setup"""
@@ -349,12 +605,15 @@ class AerocomEvaluation(object):
             cfg[k] = ObsConfigEval(**v)
         
         self.obs_config = cfg
+        self._obs_name_index = None
+        self._vert_code_cache = {}
         
     def _set_modelconfig(self, val):
         cfg = {}
         for k, v in val.items():
             cfg[k] = ModelConfigEval(**v)
         self.model_config = cfg
+        self._model_name_index = None
         self._update_custom_read_methods()
     
             
@@ -366,18 +625,24 @@ class AerocomEvaluation(object):
         elif key == 'model_config':
             self._set_modelconfig(val)
         elif key == 'colocation_settings':
-            self.colocation_settings.update(**val)
+            self.colocation_settings.update(val)
+        elif key in ('obs_ignore', 'model_ignore'):
+            self.__dict__[key] = frozenset(val or ())
         elif isinstance(key, str) and isinstance(val, dict):
             if 'obs_id' in val:
                 if key in self.obs_config:
                     self._log.warn('Obs config for key {}  already exists and '
                                    'will be overwritten {}'.format(key))
                 self.obs_config[key] = ObsConfigEval(**val)
+                self._obs_name_index = None
+                self._vert_code_cache = {}
             elif 'model_id' in val:
                 if key in self.model_config:
                     self._log.warn('Model config for key {}  already exists and '
                                    'will be overwritten {}'.format(key))
                 self.model_config[key] = ModelConfigEval(**val)
+                self._model_name_index = None
+                self._model_cfg_cache.pop(key, None)
             else:
                 self.__dict__[key] = val
         elif key in self.__dict__:
@@ -386,6 +651,22 @@ class AerocomEvaluation(object):
             raise KeyError('Invalid input key {}. Cannot assign {}'
                            .format(key, val))
                 
+    def __getstate__(self):
+        # needed for pickling (e.g. parallel computation of json files), 
+        # cached data is not transferred. Custom read methods are kept, since
+        # they are required for colocation in worker processes (module level
+        # functions are pickled by reference)
+        state = self.__dict__.copy()
+        state['_log'] = None
+        state['_station_cache'] = {}
+        state['_model_cfg_cache'] = {}
+        state['_fun_cache'] = {}
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._log = const.print_log
+        
     def __getitem__(self, key):
         if key in self.__dict__:
             return self.__dict__[key]
@@ -444,26 +725,38 @@ class AerocomEvaluation(object):
     def get_model_id(self, model_name):
         """Get AeroCom ID for model name
         """
-        for name, info in self.model_config.items():
-            if name == model_name:
-                return info['model_id']
-        raise KeyError('Cannot find setup for ID {}'.format(model_name))
+        if not model_name in self.model_config:
+            raise KeyError('Cannot find setup for ID {}'.format(model_name))
+        return self.model_config[model_name]['model_id']
     
     def get_obs_id(self, obs_name):
         """Get AeroCom ID for obs name
         """
-        for name, info in self.obs_config.items():
-            if name == obs_name:
-                return info['obs_id']
-        raise KeyError('Cannot find setup for ID {}'.format(obs_name))
+        if not obs_name in self.obs_config:
+            raise KeyError('Cannot find setup for ID {}'.format(obs_name))
+        return self.obs_config[obs_name]['obs_id']
     
+    def _build_name_indices(self):
+        """Build reverse lookup tables for :func:`find_obs_name` and 
+        :func:`find_model_name`"""
+        obs_idx, model_idx = {}, {}
+        for obs_name, info in self.obs_config.items():
+            for obs_var in info['obs_vars']:
+                matches = obs_idx.setdefault((info['obs_id'], obs_var), [])
+                if not obs_name in matches:
+                    matches.append(obs_name)
+        for model_name, info in self.model_config.items():
+            model_idx.setdefault(info['model_id'], []).append(model_name)
+        self._obs_name_index = obs_idx
+        self._model_name_index = model_idx
+        
     def find_obs_name(self, obs_id, obs_var):
         """Find web menu name of obs dataset based on obs_id and variable
         """
-        matches = []
-        for obs_name, info in self.obs_config.items():
-            if info['obs_id'] == obs_id and obs_var in info['obs_vars']:
-                matches.append(obs_name)
+        key = (obs_id, obs_var)
+        if self._obs_name_index is None or not key in self._obs_name_index:
+            self._build_name_indices()
+        matches = self._obs_name_index.get(key, [])
         if len(matches) == 1:
             return matches[0]
         raise ValueError('Could not identify unique obs name')
@@ -471,10 +764,10 @@ class AerocomEvaluation(object):
     def find_model_name(self, model_id):
         """Find web menu name of model dataset based on model_id
         """
-        matches = []
-        for model_name, info in self.model_config.items():
-            if info['model_id'] == model_id:
-                matches.append(model_name)
+        if (self._model_name_index is None or 
+            not model_id in self._model_name_index):
+            self._build_name_indices()
+        matches = self._model_name_index.get(model_id, [])
         if len(matches) == 1:
             return matches[0]
         raise ValueError('Could not identify unique model name')
@@ -483,7 +776,7 @@ class AerocomEvaluation(object):
         """Creates file regions.ini for web interface"""
         regs = {}
         for regname in get_all_default_region_ids():
-            reg = Region(regname)
+            reg = _cached_region(regname)
             regs[regname] = r = {}
             latr = reg.lat_range
             r['minLat'] = latr[0]
@@ -494,16 +787,176 @@ class AerocomEvaluation(object):
         save_dict_json(regs, self.regions_file)
         return regs
     
+    def _stack_latlon(self, arr):
+        """Stack latitude and longitude dimension into station_name
+        
+        Equivalent to ``arr.stack(station_name=('latitude', 'longitude'))``,
+        but the stacked :class:`pandas.MultiIndex` is cached for each grid, 
+        so that it does not need to be rebuilt for each file of an experiment 
+        (non-dimension coordinates are not retained).
+        
+        Parameters
+        ----------
+        arr : DataArray
+            gridded colocated data
+            
+        Returns
+        -------
+        DataArray
+            stacked data
+        """
+        lats = arr.latitude.values
+        lons = arr.longitude.values
+        key = (lats.tobytes(), lons.tobytes())
+        if not key in self._stack_cache:
+            if len(self._stack_cache) > 8:
+                self._stack_cache.clear()
+            self._stack_cache[key] = pd.MultiIndex.from_product(
+                    [lats, lons], names=['latitude', 'longitude'])
+        idx = self._stack_cache[key]
+        dims = [d for d in arr.dims if not d in ('latitude', 'longitude')]
+        arr = arr.transpose(*dims, 'latitude', 'longitude')
+        vals = arr.values.reshape(arr.shape[:-2] + (len(idx),))
+        coords = {d : arr[d].values for d in dims}
+        coords['station_name'] = idx
+        return xarray.DataArray(vals, coords=coords, 
+                                dims=dims + ['station_name'], 
+                                name=arr.name, attrs=arr.attrs)
+    
+    def _get_resample_cache_file(self, source_file, freq):
+        """Get path of cache file for resampled colocated data 
+        
+        The file name is a hash of the source file path, its modification 
+        time, the output frequency and the time resampling settings in 
+        :attr:`colocation_settings`, so that cached data is invalidated if 
+        any of these change.
+        
+        Parameters
+        ----------
+        source_file : str
+            path of colocated data NetCDF file
+        freq : str
+            output frequency
+            
+        Returns
+        -------
+        str or None
+            path of cache file, or None if caching is deactivated (i.e. if 
+            ``resample_cache_dir`` is not set in :attr:`colocation_settings`)
+        """
+        colstp = self.colocation_settings
+        cache_dir = colstp['resample_cache_dir']
+        if cache_dir is None:
+            return None
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+        key = '{};{};{};{};{};{}'.format(os.path.abspath(source_file), 
+                                         os.path.getmtime(source_file), 
+                                         freq, 
+                                         colstp.apply_time_resampling_constraints,
+                                         colstp.min_num_obs,
+                                         colstp.colocate_time)
+        fname = '{}.nc'.format(hashlib.sha1(key.encode()).hexdigest())
+        return os.path.join(cache_dir, fname)
+    
+    def _read_resample_cache(self, cache_file):
+        """Read cached resampled colocated data
+        
+        Returns
+        -------
+        xarray.DataArray or None
+            cached data, or None if the cache file does not exist or cannot 
+            be read (in which case it is removed)
+        """
+        if not os.path.exists(cache_file):
+            return None
+        try:
+            with xarray.open_dataarray(cache_file) as arr:
+                arr = arr.load()
+        except Exception as e:
+            self._log.warning('Failed to read resample cache file {}, file '
+                              'will be removed. Error: {}'
+                              .format(cache_file, repr(e)))
+            try:
+                os.unlink(cache_file)
+            except OSError:
+                pass
+            return None
+        return ColocatedData._decode_min_num_obs(arr)
+    
+    def _write_resample_cache(self, arr, cache_file):
+        """Write resampled colocated data to cache file
+        
+        The data is written to a temporary file first, which is renamed when
+        complete, so that interrupted runs do not leave incomplete cache 
+        files.
+        """
+        # to_netcdf modifies the attributes of the data in place
+        arr = arr.copy(deep=False)
+        arr.attrs = dict(arr.attrs)
+        cache_dir = os.path.dirname(cache_file)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix='tmp_', 
+                                        suffix='.nc')
+        os.close(fd)
+        try:
+            ColocatedData(arr).to_netcdf(cache_dir, 
+                                         savename=os.path.basename(tmp_path))
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, cache_file)
+        except:
+            os.unlink(tmp_path)
+            raise
+    
+    def clear_resample_cache(self):
+        """Delete all files in the resample cache directory
+        
+        The cache directory is specified by ``resample_cache_dir`` in 
+        :attr:`colocation_settings` (cf. :func:`_get_resample_cache_file`).
+        Cache files are not removed automatically when they become outdated,
+        so this should be called from time to time. Only cache files (and
+        temporary files left by interrupted runs) are deleted.
+        """
+        cache_dir = self.colocation_settings['resample_cache_dir']
+        if cache_dir is None:
+            return
+        for file in iter_files(cache_dir, '*.nc'):
+            if _RESAMPLE_CACHE_FILE_RE.match(os.path.basename(file)):
+                os.unlink(file)
+    
     def compute_json_files_from_colocateddata(self, coldata, obs_name=None, 
-                                              model_name=None):
-        """Creates all json files for one ColocatedData object"""
+                                              model_name=None, 
+                                              source_file=None,
+                                              heatmap_buffer=None):
+        """Creates all json files for one ColocatedData object
+        
+        Parameters
+        ----------
+        coldata : ColocatedData
+            colocated data object
+        obs_name : str, optional
+            name of observation network
+        model_name : str, optional
+            name of model
+        source_file : str, optional
+            path of NetCDF file from which ``coldata`` was loaded. If provided 
+            and if ``resample_cache_dir`` is set in 
+            :attr:`colocation_settings`, the time-resampled data is cached 
+            on disk and reused in subsequent runs.
+        heatmap_buffer : list, optional
+            if provided, the input arguments for :func:`_write_heatmap_json`
+            are appended to this list rather than writing the heatmap json
+            file (used for processing of multiple files in parallel).
+        """
         if not isinstance(coldata, ColocatedData):
             raise ValueError('Need ColocatedData object, got {}'
                              .format(type(coldata)))
         stats_dummy = {}
         
+        # NaNs are written as null by orjson, else they are replaced by None
+        # in advance, so that the data can be serialised without NaN handling
+        invalid = np.nan if ORJSON_AVAILABLE else None
         for k in calc_statistics([1], [1]):
-            stats_dummy[k] = np.nan
+            stats_dummy[k] = invalid
         
         stacked = False
         if 'altitude' in coldata.data.dims:
@@ -517,8 +970,7 @@ class AerocomEvaluation(object):
                 raise DataDimensionError('Need latitude and longitude '
                                          'dimension. Got {}'
                                          .format(coldata.data.dims))
-            coldata.data = coldata.data.stack(station_name=('latitude', 
-                                                            'longitude'))
+            coldata.data = self._stack_latlon(coldata.data)
             stacked = True
             
         ts_types_order = const.GRID_IO.TS_TYPES
@@ -528,27 +980,35 @@ class AerocomEvaluation(object):
         jsdate = dict.fromkeys(to_ts_types)
         
         ts_type = coldata.meta['ts_type']
+        ts_idx = ts_types_order.index(ts_type)
+        freq_idx = {f : ts_types_order.index(f) for f in to_ts_types}
         for freq in to_ts_types:
-            if ts_types_order.index(freq) < ts_types_order.index(ts_type):
+            if freq_idx[freq] < ts_idx:
                 data_arrs[freq] = None
-            elif ts_types_order.index(freq) == ts_types_order.index(ts_type):
+            elif freq_idx[freq] == ts_idx:
                 data_arrs[freq] = coldata.data
                 
-                js = (coldata.data.time.values.astype('datetime64[s]') - 
-                      np.datetime64('1970', '[s]')).astype(int) * 1000
-                jsdate[freq] = js.tolist()
+                jsdate[freq] = _to_jsdate(coldata.data.time.values)
                 
             else:
-                colstp = self.colocation_settings
-                _a = coldata.resample_time(to_ts_type=freq,
-                                     apply_constraints=colstp.apply_time_resampling_constraints, 
-                                     min_num_obs=colstp.min_num_obs,
-                                     colocate_time=colstp.colocate_time,
-                                     inplace=False).data
+                cache_file = None
+                if source_file is not None and not stacked:
+                    cache_file = self._get_resample_cache_file(source_file, 
+                                                               freq)
+                _a = None
+                if cache_file is not None:
+                    _a = self._read_resample_cache(cache_file)
+                if _a is None:
+                    colstp = self.colocation_settings
+                    _a = coldata.resample_time(to_ts_type=freq,
+                                         apply_constraints=colstp.apply_time_resampling_constraints, 
+                                         min_num_obs=colstp.min_num_obs,
+                                         colocate_time=colstp.colocate_time,
+                                         inplace=False).data
+                    if cache_file is not None:
+                        self._write_resample_cache(_a, cache_file)
                 data_arrs[freq] = _a #= resample_time_dataarray(arr, freq=freq)
-                js = (_a.time.values.astype('datetime64[s]') - 
-                      np.datetime64('1970', '[s]')).astype(int) * 1000
-                jsdate[freq] = js.tolist()      
+                jsdate[freq] = _to_jsdate(_a.time.values)
         
         #print(jsdate)
     
@@ -564,9 +1024,6 @@ class AerocomEvaluation(object):
         if model_name is None:
             model_name = self.find_model_name(model_id)
     
-        ts_objs = []
-        
-        map_data = []
         scat_data = {}
         hm_data = {}
         
@@ -608,116 +1065,148 @@ class AerocomEvaluation(object):
             
             hm_data[reg] = stats
         
-        self._write_heatmap_json(hm_data, obs_name, obs_var, vert_code, 
-                                 model_name, model_var)
+        heatmap_args = (hm_data, obs_name, obs_var, vert_code, model_name, 
+                        model_var)
+        if heatmap_buffer is None:
+            self._write_heatmap_json(*heatmap_args)
+        else:
+            heatmap_buffer.append(heatmap_args)
         
         if vert_code == 'ModelLevel':
             raise NotImplementedError('Coming soon...')
         const.print_log.info('Computing json files for {} vs. {}'
                              .format(model_name, obs_name))
-        for i, stat_name in enumerate(coldata.data.station_name.values):
-            _disp = ('{} - {} ({}) vs. {} ({})'
-                     .format(stat_name, model_name, 
-                             coldata.meta['var_name'][1],
-                             obs_name, coldata.meta['var_name'][0]))
-            has_data = False
-            ts_data = {}
-            ts_data['station_name'] = stat_name
-            ts_data['pyaerocom_version'] = pyaerocom_version
-            ts_data['obs_name'] = obs_name
-            ts_data['model_name'] = model_name
-            ts_data['obs_var'] = coldata.meta['var_name'][0]
-            ts_data['obs_unit'] = coldata.meta['var_units'][0]
-            ts_data['vert_code'] = vert_code
-            ts_data['obs_freq_src'] = coldata.meta['ts_type_src'][0]
-            ts_data['obs_revision'] = coldata.meta['revision_ref']
-            
-            ts_data['mod_var'] = coldata.meta['var_name'][1]
-            ts_data['mod_unit'] = coldata.meta['var_units'][1]
-            ts_data['mod_freq_src'] = coldata.meta['ts_type_src'][1]
-            
-            stat_lat = np.float64(coldata.data.latitude[i])
-            stat_lon = np.float64(coldata.data.longitude[i])
-            if 'altitude' in coldata.data.coords:
-                stat_alt = np.float64(coldata.data.altitude[i])
-            else:
-                stat_alt = np.nan
-            region = find_closest_region_coord(stat_lat, stat_lon)
-            
-            # station information for map view
-            map_stat = {'site'      : stat_name, 
-                        'lat'       : stat_lat, 
-                        'lon'       : stat_lon,
-                        'alt'       : stat_alt,
-                        'region'    : region}
-            
-            for tres, arr in data_arrs.items():
-                map_stat['{}_statistics'.format(tres)] = {}
-                if arr is None:
-                    ts_data['{}_date'.format(tres)] = []
-                    ts_data['{}_obs'.format(tres)] = []
-                    ts_data['{}_mod'.format(tres)] = []
-                    map_stat['{}_statistics'.format(tres)].update(stats_dummy)
-                    continue
+        # numpy arrays (station x time) of obs and model data for each 
+        # output frequency, extracted once for all stations (C-contiguous, 
+        # so that rows can be serialised directly by orjson)
+        obs_by_freq, mod_by_freq = {}, {}
+        for tres, arr in data_arrs.items():
+            if arr is None:
+                obs_by_freq[tres] = mod_by_freq[tres] = None
+                continue
+            obs_by_freq[tres] = np.ascontiguousarray(
+                    arr.sel(data_source=obs_id).transpose(
+                            'station_name', 'time').values)
+            mod_by_freq[tres] = np.ascontiguousarray(
+                    arr.sel(data_source=model_id).transpose(
+                            'station_name', 'time').values)
+        
+        # statistics for all stations, computed at once for each frequency
+        stats_by_freq = {}
+        for tres, obs_arr in obs_by_freq.items():
+            if obs_arr is not None:
+                stats = calc_statistics_batch(mod_by_freq[tres], obs_arr)
+                if not ORJSON_AVAILABLE:
+                    stats = {k : nan_to_none(v) for k, v in stats.items()}
+                stats_by_freq[tres] = stats
+                if ORJSON_AVAILABLE:
+                    # single precision is sufficient for display and orjson 
+                    # writes float32 values with their shortest representation
+                    obs_by_freq[tres] = obs_arr.astype(np.float32)
+                    mod_by_freq[tres] = mod_by_freq[tres].astype(np.float32)
+        
+        def _station_args():
+            for i in range(coldata.data.station_name.size):
+                obs_vals, mod_vals = {}, {}
+                for tres in data_arrs:
+                    if obs_by_freq[tres] is None:
+                        obs_vals[tres] = mod_vals[tres] = None
+                    else:
+                        obs_vals[tres] = obs_by_freq[tres][i]
+                        mod_vals[tres] = mod_by_freq[tres][i]
+                yield (obs_vals, mod_vals)
+        
+        stat_names = coldata.data.station_name.values
+        lat_arr = coldata.data.latitude.values
+        lon_arr = coldata.data.longitude.values
+        if 'altitude' in coldata.data.coords:
+            alt_arr = coldata.data.altitude.values
+        else:
+            alt_arr = np.full(len(stat_names), np.nan)
+        regions = find_closest_region_coords(lat_arr, lon_arr)
+        if ORJSON_AVAILABLE:
+            lat_arr = lat_arr.astype(np.float64)
+            lon_arr = lon_arr.astype(np.float64)
+            alt_arr = alt_arr.astype(np.float64)
+        else:
+            lat_arr = nan_to_none(lat_arr)
+            lon_arr = nan_to_none(lon_arr)
+            alt_arr = nan_to_none(alt_arr)
+        results = (_process_station(obs_vals, mod_vals, jsdate)
+                   for obs_vals, mod_vals in _station_args())
         
-                obs_vals = arr.sel(data_source=obs_id, 
-                                   station_name=stat_name).values
-
-                if all(np.isnan(obs_vals)):
-                    _disp += ': No obs data'
-                    ts_data['{}_date'.format(tres)] = []
-                    ts_data['{}_obs'.format(tres)] = []
-                    ts_data['{}_mod'.format(tres)] = []
-                    map_stat['{}_statistics'.format(tres)].update(stats_dummy)
-                    continue
-                has_data = True
-                mod_vals = arr.sel(data_source=model_id, 
-                                   station_name=stat_name).values
-                
-                if not len(jsdate[tres]) == len(obs_vals):
-                    raise Exception('Please debug...')
-                
-                ts_data['{}_date'.format(tres)] = jsdate[tres]
-                ts_data['{}_obs'.format(tres)] = obs_vals.tolist()
-                ts_data['{}_mod'.format(tres)] = mod_vals.tolist()
-                
-                station_statistics = calc_statistics(mod_vals, obs_vals)
-                for k, v in station_statistics.items():
-                    station_statistics[k] = np.float64(v)
-                map_stat['{}_statistics'.format(tres)] = station_statistics
-            
-            if has_data:
-                _disp += ': OK'
-                ts_objs.append(ts_data)
-                map_data.append(map_stat)
-                scat_data[str(stat_name)] = sc = {}
-                sc['obs'] = ts_data['monthly_obs']
-                sc['mod'] = ts_data['monthly_mod']
-                sc['region'] = region
-            const.print_log.info(_disp)
         dirs = self.out_dirs
-    
         map_name = self.get_json_mapname(obs_name, obs_var, model_name, 
                                          model_var, vert_code)
-        
         outfile_map =  os.path.join(dirs['map'], map_name)
-        with open(outfile_map, 'w') as f:
-            simplejson.dump(map_data, f, ignore_nan=True)
-        
-        outfile_scat =  os.path.join(dirs['scat'], map_name)
-        with open(outfile_scat, 'w') as f:
-            simplejson.dump(scat_data, f, ignore_nan=True)
+        # station entries for map view are written one by one
+        with json_array_writer(outfile_map) as add_map_stat:
+            for i, (stat_name, result) in enumerate(zip(stat_names, results)):
+                ts_vals, freqs_avail, msg = result
+                has_data = len(freqs_avail) > 0
+                _disp = ('{} - {} ({}) vs. {} ({}){}'
+                         .format(stat_name, model_name, 
+                                 coldata.meta['var_name'][1],
+                                 obs_name, coldata.meta['var_name'][0], msg))
+                ts_data = {}
+                ts_data['station_name'] = stat_name
+                ts_data['pyaerocom_version'] = pyaerocom_version
+                ts_data['obs_name'] = obs_name
+                ts_data['model_name'] = model_name
+                ts_data['obs_var'] = coldata.meta['var_name'][0]
+                ts_data['obs_unit'] = coldata.meta['var_units'][0]
+                ts_data['vert_code'] = vert_code
+                ts_data['obs_freq_src'] = coldata.meta['ts_type_src'][0]
+                ts_data['obs_revision'] = coldata.meta['revision_ref']
+            
+                ts_data['mod_var'] = coldata.meta['var_name'][1]
+                ts_data['mod_unit'] = coldata.meta['var_units'][1]
+                ts_data['mod_freq_src'] = coldata.meta['ts_type_src'][1]
+                ts_data.update(ts_vals)
             
-        for ts_data in ts_objs:
-            #writes json file
-            self._write_stationdata_json(ts_data)
+                stat_lat = lat_arr[i]
+                stat_lon = lon_arr[i]
+                stat_alt = alt_arr[i]
+                region = regions[i]
+            
+                # station information for map view
+                map_stat = {'site'      : stat_name, 
+                            'lat'       : stat_lat, 
+                            'lon'       : stat_lon,
+                            'alt'       : stat_alt,
+                            'region'    : region}
+            
+                for tres in data_arrs:
+                    station_statistics = {}
+                    if tres in freqs_avail:
+                        for k, v in stats_by_freq[tres].items():
+                            station_statistics[k] = v[i]
+                    else:
+                        station_statistics.update(stats_dummy)
+                    map_stat['{}_statistics'.format(tres)] = station_statistics
+            
+                if has_data:
+                    _disp += ': OK'
+                    self._write_stationdata_json(ts_data)
+                    add_map_stat(map_stat)
+                    scat_data[str(stat_name)] = sc = {}
+                    sc['obs'] = ts_data['monthly_obs']
+                    sc['mod'] = ts_data['monthly_mod']
+                    sc['region'] = region
+                const.print_log.info(_disp)
+        outfile_scat =  os.path.join(dirs['scat'], map_name)
+        write_json_compact(scat_data, outfile_scat)
          
     def get_vert_code(self, obs_name, obs_var):
         """Get vertical code name for obs / var combination"""
+        key = (obs_name, obs_var)
+        if key in self._vert_code_cache:
+            return self._vert_code_cache[key]
         info =  self.obs_config[obs_name]['obs_vert_type']
-        if isinstance(info, str):
-            return info
-        return info[obs_var]
+        if not isinstance(info, str):
+            info = info[obs_var]
+        self._vert_code_cache[key] = info
+        return info
     
     @property
     def _heatmap_file(self):
@@ -808,37 +1297,54 @@ class AerocomEvaluation(object):
             simplejson.dump(current, f, ignore_nan=True)
         
     def _write_stationdata_json(self, ts_data):
+        """Add timeseries data of one station and model to station cache
         
+        The corresponding json file is loaded (if it exists) the first time 
+        it is accessed and kept in :attr:`_station_cache` until 
+        :func:`flush_station_cache` is called.
+        """
         filename = self.get_stationfile_name(ts_data['station_name'], 
                                              ts_data['obs_name'],
                                              ts_data['obs_var'],
                                              ts_data['vert_code'])
     
         fp = os.path.join(self.out_dirs['ts'], filename)
+        if not fp in self._station_cache:
+            self._load_station_file(fp)
+        self._station_cache[fp][ts_data['model_name']] = ts_data
+    
+    def _load_station_file(self, fp):
+        """Load content of station json file into station cache"""
         if os.path.exists(fp):
             try:
-                with open(fp, 'r') as f:
-                    current = simplejson.load(f)
+                current = read_json(fp)
             except Exception as e:
                 raise Exception('Fatal: could not open existing json file: {}. '
                                 'Reason: {}'.format(fp, repr(e)))
         else:
             current = {}
-        current[ts_data['model_name']] = ts_data
-        with open(fp, 'w') as f:
-            simplejson.dump(current, f, ignore_nan=True)
+        self._station_cache[fp] = current
+    
+    def flush_station_cache(self):
+        """Write all cached station timeseries data to json files
+        
+        Each file in :attr:`_station_cache` is written once and the cache is
+        emptied afterwards.
+        """
+        for fp, current in self._station_cache.items():
+            write_json_compact(current, fp)
+        self._station_cache = {}
             
     def get_stationfile_name(self, station_name, obs_name, obs_var, vert_code):
         """Get name of station timeseries file"""
-        return ('{}_OBS-{}:{}_{}.json'
-                .format(station_name, obs_name, obs_var, vert_code))
+        return _stationfile_name(station_name, obs_name, obs_var, vert_code)
     
     
     def get_json_mapname(self, obs_name, obs_var, model_name, model_var, 
                            vert_code):
         """Get name base name of json file""" 
-        return ('OBS-{}:{}_{}_MOD-{}:{}.json'
-                .format(obs_name, obs_var, vert_code, model_name, model_var))
+        return _json_mapname(obs_name, obs_var, model_name, model_var, 
+                             vert_code)
     
     def find_coldata_files(self, model_name, obs_name, var_name=None):
         """Find colocated data files for a certain model/obs/var combination
@@ -884,7 +1390,8 @@ class AerocomEvaluation(object):
         return files
     
     def make_json_files(self, model_name, obs_name, var_name=None,
-                        colocator=None):
+                        colocator=None, flush_station_cache=True,
+                        heatmap_buffer=None):
         """Convert colocated data file(s) in model data directory into json
         
         Parameters
@@ -903,6 +1410,14 @@ class AerocomEvaluation(object):
             than all colocated data files are processed that are located in the
             corresponding colocation data directory and that match the input 
             specs.
+        flush_station_cache : bool
+            if True, the station timeseries json files are written at the end
+            (cf. :func:`flush_station_cache`), else they remain cached, e.g. 
+            for processing further models of the same observation network.
+        heatmap_buffer : list, optional
+            if provided, heatmap results are not written but appended to this 
+            list (cf. :func:`compute_json_files_from_colocateddata`). Only 
+            used for serial processing of the files.
         
         Returns
         -------
@@ -930,10 +1445,34 @@ class AerocomEvaluation(object):
                                      'status skipped or saved)'
                                      .format(fname, colocator.file_status[fname]))
                 continue
-            const.print_log.info('Processing file {}'.format(file))
-            d = ColocatedData(file)
-            self.compute_json_files_from_colocateddata(d, obs_name, model_name)
             converted.append(file)
+        
+        num_proc = self.num_proc_files
+        if num_proc is not None and num_proc > 1 and len(converted) > 1:
+            # the files are processed in separate processes, writes to shared
+            # files (station and heatmap json files) are done here
+            with ProcessPoolExecutor(max_workers=num_proc) as executor:
+                results = executor.map(_make_json_files_worker, 
+                                       repeat(self), converted, 
+                                       repeat(obs_name), repeat(model_name))
+                for file, (station_data, heatmap_args) in zip(converted, 
+                                                               results):
+                    const.print_log.info('Processed file {}'.format(file))
+                    for fp, data in station_data.items():
+                        if not fp in self._station_cache:
+                            self._load_station_file(fp)
+                        self._station_cache[fp].update(data)
+                    for args in heatmap_args:
+                        self._write_heatmap_json(*args)
+        else:
+            for file in converted:
+                const.print_log.info('Processing file {}'.format(file))
+                d = ColocatedData(file)
+                self.compute_json_files_from_colocateddata(
+                        d, obs_name, model_name, source_file=file,
+                        heatmap_buffer=heatmap_buffer)
+        if flush_station_cache:
+            self.flush_station_cache()
         return converted
     
     def delete_all_colocateddata_files(self, model_name, obs_name):
@@ -941,13 +1480,14 @@ class AerocomEvaluation(object):
         #obs_id = self.get_obs_id(obs_name)
         obs_vars = self.obs_config[obs_name]['obs_vars']
     
-        for obs_var in obs_vars:
-            files = glob.glob('{}/{}/{}*REF-{}*.nc'
-                              .format(self.coldata_dir, model_name, obs_var, 
-                                      obs_name))
-            for file in files:
+        patterns = ['{}*REF-{}*.nc'.format(obs_var, obs_name) 
+                    for obs_var in obs_vars]
+        for file in iter_files(os.path.join(self.coldata_dir, model_name), 
+                               '*.nc'):
+            fname = os.path.basename(file)
+            if any(fnmatch(fname, pattern) for pattern in patterns):
                 const.print_log.info('DELETING FILE: {}'.format(file))
-                os.remove(file)
+                os.unlink(file)
             
     def run_colocation(self, model_name, obs_name, var_name=None):
         """Run colocation for model / obs combination
@@ -977,7 +1517,7 @@ class AerocomEvaluation(object):
             self.delete_all_colocateddata_files(model_name, obs_name)
             
         col = Colocator()
-        col.update(**self.colocation_settings)
+        col.update(self.colocation_settings)
         
         if not model_name in self.model_config:
             raise KeyError('No such model name in configuration: {}. Available '
@@ -990,8 +1530,8 @@ class AerocomEvaluation(object):
         obs_cfg = self.obs_config[obs_name]
         if obs_cfg['obs_vert_type'] in self.VERT_SCHEMES and not 'vert_scheme' in obs_cfg:
             obs_cfg['vert_scheme'] = self.VERT_SCHEMES[obs_cfg['obs_vert_type']]
-        col.update(**obs_cfg)
-        col.update(**self.get_model_config(model_name))
+        col.update(obs_cfg)
+        col.update(self.iter_model_config(model_name))
         
         const.print_log.info('Running colocation of {} against {}'
                              .format(model_name, obs_name))
@@ -1030,25 +1570,57 @@ class AerocomEvaluation(object):
         dict
             Dictionary that specifies the model setup ready for the analysis
         """
+        return self._resolve_model_config(model_name).copy()
+    
+    def iter_model_config(self, model_name):
+        """Iterate over model configuration
+        
+        Like :func:`get_model_config`, but returns an iterator over 
+        (key, value) pairs, e.g. for updating a :class:`ColocationSetup` 
+        without creating an intermediate dictionary.
+        
+        Parameters
+        ----------
+        model_name : str
+            name of model run
+            
+        Returns
+        -------
+        iterator
+            (key, value) pairs of model setup
+        """
+        return iter(self._resolve_model_config(model_name).items())
+    
+    def _resolve_model_config(self, model_name):
+        """Get model config with custom read methods resolved (cached)
+        
+        Note
+        ----
+        The returned dictionary is shared, use :func:`get_model_config` for
+        a copy.
+        """
         mcfg = self.model_config[model_name]
-        outcfg = {}
-        if not 'model_id' in mcfg:
+        try:
+            cfg_id, outcfg = self._model_cfg_cache[model_name]
+            if cfg_id == id(mcfg):
+                return outcfg
+        except KeyError:
+            pass
+        if 'model_id' not in mcfg:
             raise ValueError('Model configuration for {} is missing '
                              'specification of model_id '.format(model_name))
-        for key, val in mcfg.items():
-            
-            if key != 'model_read_aux':
-                outcfg[key] = val
-            else:
-                outcfg[key] = d = {}
-                for var, rcfg in val.items():
-                    d[var] = {}
-                    d[var]['vars_required'] = rcfg['vars_required']
-                    fun_str = rcfg['fun']
-                    if not isinstance(fun_str, str):
-                        raise Exception('Unexpected error. Custom method defs. '
-                                        'need to be strings, got {}'.format(fun_str))
-                    d[var]['fun'] = self.get_custom_read_method_model(fun_str)
+        outcfg = {k : v for k, v in mcfg.items() if k != 'model_read_aux'}
+        if mcfg.get('model_read_aux') is not None:
+            outcfg['model_read_aux'] = d = {}
+            for var, rcfg in mcfg['model_read_aux'].items():
+                d[var] = {}
+                d[var]['vars_required'] = rcfg['vars_required']
+                fun_str = rcfg['fun']
+                if not isinstance(fun_str, str):
+                    raise Exception('Unexpected error. Custom method defs. '
+                                    'need to be strings, got {}'.format(fun_str))
+                d[var]['fun'] = self._get_custom_read_method_cached(fun_str)
+        self._model_cfg_cache[model_name] = (id(mcfg), outcfg)
         return outcfg
             
     def find_model_matches(self, name_or_pattern):
@@ -1073,14 +1645,7 @@ class AerocomEvaluation(object):
         """
         
         
-        if isinstance(name_or_pattern, str):
-            name_or_pattern = [name_or_pattern]
-        from fnmatch import fnmatch
-        matches = []
-        for search_pattern in name_or_pattern:
-            for mname in self.model_config:
-                if fnmatch(mname, search_pattern) and not mname in matches:
-                    matches.append(mname)
+        matches = _find_matches(self.model_config, name_or_pattern)
         if len(matches) == 0:
             raise KeyError('No models could be found that match input {}'
                            .format(name_or_pattern))
@@ -1108,13 +1673,7 @@ class AerocomEvaluation(object):
         """
         
         
-        if isinstance(name_or_pattern, str):
-            name_or_pattern = [name_or_pattern]
-        matches = []
-        for search_pattern in name_or_pattern:
-            for mname in self.obs_config:
-                if fnmatch(mname, search_pattern) and not mname in matches:
-                    matches.append(mname)
+        matches = _find_matches(self.obs_config, name_or_pattern)
         if len(matches) == 0:
             raise KeyError('No observations could be found that match input {}'
                            .format(name_or_pattern))
@@ -1194,28 +1753,88 @@ class AerocomEvaluation(object):
         
         self._update_custom_read_methods()
         
+        log_info = self._log.info
+        run_colocation = self.run_colocation
+        make_json_files = self.make_json_files
+        obs_list = self._filter_ignored(obs_list, self.obs_ignore, 
+                                        'observation')
+        model_list = self._filter_ignored(model_list, self.model_ignore, 
+                                          'model')
+        num_proc = self.num_proc_runs
+        parallel = num_proc is not None and num_proc > 1
         for obs_name in obs_list:
-            if obs_name in self.obs_ignore:
-                self._log.info('Skipping observation {}'.format(obs_name))
+            if parallel and len(model_list) > 1:
+                res = self._run_models_parallel(obs_name, model_list, 
+                                                var_name, num_proc)
+                # station files are specific for each observation network
+                self.flush_station_cache()
                 continue
             for model_name in model_list:
-                if model_name in self.model_ignore:
-                    self._log.info('Skipping model {}'.format(model_name))
+                col = run_colocation(model_name, obs_name, var_name)
+                if self.only_colocation:
+                    log_info('Skipping computation of json files for {}'
+                             '/{}'.format(obs_name, model_name))
                     continue
-            
-                col = self.run_colocation(model_name, obs_name, var_name)
-                if only_colocation:
-                    self._log.info('Skipping computation of json files for {}'
-                                   '/{}'.format(obs_name, model_name))
-                    continue
-                res = self.make_json_files(model_name, obs_name, var_name,
-                                           colocator=col)
+                res = make_json_files(model_name, obs_name, var_name,
+                                      colocator=col, 
+                                      flush_station_cache=False)
+            # station files are specific for each observation network
+            self.flush_station_cache()
         
         if update_interface:
             #self.clean_json_files()
             self.update_interface()
 
         return res            
+    
+    def _filter_ignored(self, names, ignore, what):
+        """Remove names that are supposed to be ignored (and log them)"""
+        if not ignore:
+            return names
+        result = []
+        for name in names:
+            if name in ignore:
+                self._log.info('Skipping {} {}'.format(what, name))
+            else:
+                result.append(name)
+        return result
+    
+    def _run_models_parallel(self, obs_name, model_list, var_name, 
+                             num_proc):
+        """Run multiple models against one observation network in parallel
+        
+        Helper for :func:`run_evaluation`. The first model is run in this 
+        process, so that the observation data is read (and written to the 
+        cache, if caching is active) only once, before the remaining models 
+        are distributed over the worker processes. Writes to shared files 
+        (station and heatmap json files) are done here, the station cache is 
+        not flushed.
+        """
+        only_colocation = self.only_colocation
+        col = self.run_colocation(model_list[0], obs_name, var_name)
+        res = None
+        if not only_colocation:
+            res = self.make_json_files(model_list[0], obs_name, var_name,
+                                       colocator=col, 
+                                       flush_station_cache=False)
+        models = model_list[1:]
+        with ProcessPoolExecutor(max_workers=num_proc) as executor:
+            results = executor.map(_run_evaluation_worker, repeat(self), 
+                                   repeat(obs_name), models, 
+                                   repeat(var_name), repeat(only_colocation))
+            for model_name, (converted, station_data, 
+                             heatmap_args) in zip(models, results):
+                self._log.info('Finished {} / {}'.format(obs_name, model_name))
+                if only_colocation:
+                    continue
+                for fp, data in station_data.items():
+                    if not fp in self._station_cache:
+                        self._load_station_file(fp)
+                    self._station_cache[fp].update(data)
+                for args in heatmap_args:
+                    self._write_heatmap_json(*args)
+                res = converted
+        return res
         
     def info_string_evalrun(self, obs_list, model_list):
         """Short information string that summarises settings for evaluation run
@@ -1239,10 +1858,11 @@ class AerocomEvaluation(object):
              'Harmonise units: {}'
              .format(obs_list, model_list, self['remove_outliers'], 
                      self['harmonise_units']))
-        for k, i in self._OPTS_NAMES_OUTPUT.items():
-            s += '\n{}: {}'.format(i, self[k]) 
-        s += '\n'
-        return s
+        parts = [s]
+        parts.extend('\n{}: {}'.format(i, self[k]) 
+                     for k, i in self._OPTS_NAMES_OUTPUT.items())
+        parts.append('\n')
+        return ''.join(parts)
     
     def check_read_model(self, model_name, var_name, **kwargs):
         if not model_name in self.model_config:
@@ -1265,29 +1885,27 @@ class AerocomEvaluation(object):
         return r.read_var(var_name, **kwargs)
         
     def _info_from_map_file(self, filename):
-        f = filename
-        obs_info = f.split('OBS-')[1].split('_MOD')[0].split('_')
-        obs_name, obs_var = obs_info[0].split(':')
-        vert_code = obs_info[1]
-        mod_name, mod_var =  f.split('MOD-')[1].split('.json')[0].split(':')
-        return (obs_name, obs_var, vert_code, mod_name, mod_var)
+        m = _MAP_FILE_RE.match(filename)
+        if m is None:
+            raise ValueError('Invalid name of map file: {}'.format(filename))
+        return m.groups()
     
     def get_web_overview_table(self):
         """Computes overview table based on existing map files"""
         tab = []
-        from pandas import DataFrame
         for f in self.all_map_files:
-            if f.endswith('.json') and f.startswith('OBS'):
+            m = _MAP_FILE_RE.match(f)
+            if m is not None:
                 (obs_name, obs_var, 
                  vert_code, 
-                 mod_name, mod_var) = self._info_from_map_file(f)
+                 mod_name, mod_var) = m.groups()
                 if mod_name in self.model_ignore:
                     continue
-                elif not mod_name in self.model_config:
+                elif mod_name not in self.model_config:
                     const.print_log.warning('Found outdated json map file: {}'
                                             'Will be ignored'.format(f))
                     continue
-                elif not obs_name in self.obs_config:
+                elif obs_name not in self.obs_config:
                     const.print_log.warning('Found outdated json map file: {}'
                                             'Will be ignored'.format(f))
                     continue
@@ -1298,7 +1916,7 @@ class AerocomEvaluation(object):
                                                 .format(f))
                         continue
                 tab.append([obs_var, obs_name, vert_code, mod_name, mod_var])
-        return DataFrame(tab, columns=['Var' , 'Obs', 'vert',
+        return pd.DataFrame(tab, columns=['Var' , 'Obs', 'vert',
                                        'Model', 'Model var'])
     
     def get_obsvar_name_and_type(self, obs_var):
@@ -1350,25 +1968,14 @@ class AerocomEvaluation(object):
         """
         table = make_info_table_evaluation_iface(self)
         outname = os.path.join(self.exp_dir, 'minfo.json')       
-        with open(outname, 'w+') as f:
-            f.write(simplejson.dumps(table, indent=2))
+        write_json_indent2(table, outname)
         return table
     
     def _obs_config_asdict(self):
-        d = {}
-        for k, cfg in self.obs_config.items():
-            as_dict = {}
-            as_dict.update(**cfg)
-            d[k] = as_dict
-        return d
+        return {k : dict(cfg) for k, cfg in self.obs_config.items()}
     
     def _model_config_asdict(self):
-        d = {}
-        for k, cfg in self.model_config.items():
-            as_dict = {}
-            as_dict.update(**cfg)
-            d[k] = as_dict
-        return d        
+        return {k : dict(cfg) for k, cfg in self.model_config.items()}
     
     def delete_experiment_data(self, base_dir=None, proj_id=None, exp_id=None):
         """Delete all data associated with a certain experiment
@@ -1382,7 +1989,6 @@ class AerocomEvaluation(object):
         exp_name : str, optional
             name experiment, if None, then this project is used
         """
-        from pyaerocom.web.helpers import delete_experiment_data_evaluation_iface
         if proj_id is None:
             proj_id = self.proj_id
         if exp_id is None:
@@ -1418,7 +2024,7 @@ class AerocomEvaluation(object):
             if remove:
                 const.print_log.info('Removing outdated map file: {}'.format(file))
                 os.remove(os.path.join(self.out_dirs['map'], file))
-        for fp in glob.glob('{}/*.json'.format(self.out_dirs['ts'])):
+        for fp in iter_files(self.out_dirs['ts'], '*.json'):
             self._check_clean_ts_file(fp)
         if update_interface:
             self.update_interface()
@@ -1472,21 +2078,19 @@ class AerocomEvaluation(object):
         
     def to_dict(self):
         """Convert configuration to dictionary"""
+        special = {'model_config' : self._model_config_asdict,
+                   'obs_config'   : self._obs_config_asdict}
+        ignore = self.JSON_CFG_IGNORE
         d = {}
         for key, val in self.__dict__.items():
-            if key in self.JSON_CFG_IGNORE:
+            if key in ignore:
                 continue
+            elif key in special:
+                d[key] = special[key]()
             elif isinstance(val, dict):
-                if key == 'model_config':
-                    sub = self._model_config_asdict()
-                elif key == 'obs_config':
-                    sub = self._obs_config_asdict()
-                else:
-                    sub = {}
-                    for k, v in val.items():
-                        if v is not None:
-                            sub[k] = v
-                d[key] = sub
+                d[key] = {k : v for k, v in val.items() if v is not None}
+            elif isinstance(val, (set, frozenset)):
+                d[key] = sorted(val)
             else:
                 d[key] = val
         return d
@@ -1506,13 +2110,12 @@ class AerocomEvaluation(object):
                 config_dir = self.config_dir
             else:
                 config_dir = '.'
-        files = glob.glob('{}/cfg_{}_{}.json'.format(config_dir, proj_id, 
-                          exp_id))
-        if len(files) == 0:
+        fp = os.path.join(config_dir, 'cfg_{}_{}.json'.format(proj_id, exp_id))
+        if not os.path.isfile(fp):
             raise ValueError('No config file could be found in {} for '
                              'project {} and experiment {}'.format(config_dir, 
                               proj_id, exp_id))
-        self.from_json(files[0])
+        self.from_json(fp)
         
     def from_json(self, config_file):
         """Load configuration from json config file"""
@@ -1524,24 +2127,24 @@ class AerocomEvaluation(object):
         indent = 2
         _indent_str = indent*' '
         head = "Pyaerocom {}".format(type(self).__name__)
-        s = "\n{}\n{}".format(head, len(head)*"-")
-        s += ('\nProject ID: {}'
-              '\nEperiment ID: {}'
-              '\nExperiment name: {}'
-              .format(self.proj_id, self.exp_id, self.exp_name))
-        s += '\ncolocation_settings: (will be updated for each run from model_config and obs_config entry)'
-        for k, v in self.colocation_settings.items():
-            s += '\n{}{}: {}'.format(_indent_str, k, v)
-        s += '\n\nobs_config:'
+        parts = ["\n{}\n{}".format(head, len(head)*"-")]
+        parts.append('\nProject ID: {}'
+                     '\nEperiment ID: {}'
+                     '\nExperiment name: {}'
+                     .format(self.proj_id, self.exp_id, self.exp_name))
+        parts.append('\ncolocation_settings: (will be updated for each run from model_config and obs_config entry)')
+        parts.extend('\n{}{}: {}'.format(_indent_str, k, v) 
+                     for k, v in self.colocation_settings.items())
+        parts.append('\n\nobs_config:')
         for k, v in self.obs_config.items():
-            s += '\n\n{}{}:'.format(_indent_str, k)
-            s = dict_to_str(v, s, indent=indent+2)
-        s += '\n\nmodel_config:'
+            parts.append('\n\n{}{}:'.format(_indent_str, k))
+            _dict_to_str_parts(v, parts, indent=indent+2)
+        parts.append('\n\nmodel_config:')
         for k, v in self.model_config.items():
-            s += '\n\n{}{}:'.format(_indent_str,  k)
-            s = dict_to_str(v, s, indent=indent+2)
+            parts.append('\n\n{}{}:'.format(_indent_str,  k))
+            _dict_to_str_parts(v, parts, indent=indent+2)
     
-        return s
+        return ''.join(parts)
     
 if __name__ == '__main__':    
     cfg_dir = '/home/jonasg/github/aerocom_evaluation/data_new/config_files/'
@@ -9,7 +9,17 @@ ToDo
 
 """
 import os, glob, shutil
+import json
+import tempfile
+from contextlib import contextmanager
+from fnmatch import fnmatch
+import numpy as np
 import simplejson
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 from pyaerocom import const
 from pyaerocom._lowlevel_helpers import BrowseDict, sort_dict_by_name
 
@@ -346,6 +356,86 @@ def update_menu_evaluation_iface(config, ignore_experiments=None):
     with open(config.menu_file, 'w+') as f:
         f.write(simplejson.dumps(new_menu, indent=4))
  
+@contextmanager
+def json_array_writer(file_path):
+    """Context manager for writing a json array item by item
+    
+    The items are serialised one at a time (like in 
+    :func:`write_json_compact`) into a temporary file in the output 
+    directory, which replaces ``file_path`` on successful exit. Thus, the 
+    full list never needs to be kept in memory and no incomplete output file
+    is left behind if an error occurs.
+    
+    Parameters
+    ----------
+    file_path : str
+        output file path
+    
+    Yields
+    ------
+    callable
+        function that takes one item and appends it to the array
+    
+    Example
+    -------
+    >>> with json_array_writer('/tmp/test.json') as add:
+    ...     for i in range(3):
+    ...         add({'index' : i})
+    """
+    tmp = tempfile.NamedTemporaryFile(dir=os.path.dirname(file_path), 
+                                      prefix='.', suffix='.tmp', delete=False)
+    try:
+        with tmp as f:
+            sep = [b'[']
+            def add(item):
+                f.write(sep[0])
+                f.write(_dumps_compact(item))
+                sep[0] = b','
+            yield add
+            if sep[0] == b'[':
+                f.write(b'[')
+            f.write(b']')
+        # temporary files are created with permissions 0600
+        os.chmod(tmp.name, 0o644)
+        os.replace(tmp.name, file_path)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+
+def iter_files(root, pattern, recursive=False):
+    """Iterate over files in a directory that match a filename pattern
+    
+    Uses :func:`os.scandir`, so that no additional stat calls are needed, 
+    and avoids the overhead of :mod:`glob`. Like glob, hidden files (starting
+    with a dot) are skipped.
+    
+    Parameters
+    ----------
+    root : str
+        directory to be searched (if it does not exist, nothing is yielded)
+    pattern : str
+        filename pattern (:func:`fnmatch.fnmatch` syntax, e.g. *\*.json*)
+    recursive : bool
+        if True, sub-directories are searched as well
+    
+    Yields
+    ------
+    str
+        file path
+    """
+    try:
+        entries = list(os.scandir(root))
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        if entry.name.startswith('.'):
+            continue
+        if entry.is_dir():
+            if recursive:
+                yield from iter_files(entry.path, pattern, recursive)
+        elif fnmatch(entry.name, pattern):
+            yield entry.path
+
 def read_json(file_path):
     """Read json file
     
@@ -376,6 +466,86 @@ def write_json(data_dict, file_path, indent=4):
     with open(file_path, 'w+') as f:
         f.write(simplejson.dumps(data_dict, indent=4))
 
+def nan_to_none(data):
+    """Convert numerical array into list, with NaNs replaced by None
+    
+    The check for invalid values is done vectorised in numpy, so that the
+    output can be serialised with the standard library :mod:`json` module 
+    without the need for NaN handling in Python (None is written as null).
+    
+    Parameters
+    ----------
+    data : array-like
+        numerical data
+    
+    Returns
+    -------
+    list
+        data as list of floats, non-finite values are replaced with None
+    """
+    arr = np.asarray(data, dtype=np.float64)
+    return np.where(np.isfinite(arr), arr, None).tolist()
+
+def _dumps_compact(data):
+    """Serialise data to compact json (bytes), writing NaNs as null
+    
+    Uses orjson if available. Else, the standard library :mod:`json` module is
+    tried first, which is only valid if the data is free of NaNs (cf. 
+    :func:`nan_to_none`) and numpy integers, and :mod:`simplejson` with 
+    ``ignore_nan=True`` otherwise.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY | 
+                                         orjson.OPT_NON_STR_KEYS)
+    try:
+        return json.dumps(data, allow_nan=False, 
+                          separators=(',', ':')).encode()
+    except (ValueError, TypeError):
+        return simplejson.dumps(data, ignore_nan=True).encode()
+
+def write_json_compact(data_dict, file_path):
+    """Save json file without indentation, writing NaNs as null
+    
+    Uses orjson (if installed, including direct serialisation of numpy 
+    arrays and scalars), else the standard library :mod:`json` module or, if
+    the data contains NaNs, :func:`simplejson.dumps` with ``ignore_nan=True``.
+    
+    Parameters
+    ----------
+    data_dict : dict or list
+        data that can be written to json file
+    file_path : str
+        output file path
+    """
+    content = _dumps_compact(data_dict)
+    with open(file_path, 'wb', buffering=1024*1024) as f:
+        f.write(content)
+
+def write_json_indent2(data_dict, file_path):
+    """Save json file with indentation of 2, writing NaNs as null
+    
+    Uses orjson if installed, else :func:`simplejson.dump`. Objects that 
+    cannot be serialised (e.g. timestamps) are converted to strings.
+    
+    Parameters
+    ----------
+    data_dict : dict
+        dictionary that can be written to json file
+    file_path : str
+        output file path
+    """
+    if ORJSON_AVAILABLE:
+        content = orjson.dumps(data_dict, default=str, 
+                               option=orjson.OPT_INDENT_2 | 
+                                      orjson.OPT_SERIALIZE_NUMPY | 
+                                      orjson.OPT_NON_STR_KEYS)
+        with open(file_path, 'wb') as f:
+            f.write(content)
+    else:
+        with open(file_path, 'w') as f:
+            simplejson.dump(data_dict, f, indent=2, ignore_nan=True, 
+                            default=str)
+            
 def update_menu_trends_iface(config):
     """Update menu for Aerosol trends interface
     
@@ -511,9 +681,10 @@ def make_info_table_evaluation_iface(config):
                     oi[obs_name] = motab = {}
                     motab['model_var'] = mvar
                     motab['obs_id'] = config.get_obs_id(obs_name)
-                    files = glob.glob('{}/{}/{}*REF-{}*.nc'
-                                      .format(config.coldata_dir, 
-                                              model_id, mvar, obs_name))
+                    files = list(iter_files(os.path.join(config.coldata_dir, 
+                                                         model_id),
+                                            '{}*REF-{}*.nc'.format(mvar, 
+                                                                   obs_name)))
                     
                     if not len(files) == 1:
                         if len(files) > 1: